@@ -25,7 +25,8 @@ class ProcessVideosUseCase:
         video_config: VideoConfig,
         audio_config: AudioConfig,
         video_input_path: str,
-        execution_threads: int = 2
+        execution_threads: int = 2,
+        fragmented_mp4: bool = False
     ):
         """
         Initializes the use case.
@@ -39,6 +40,7 @@ class ProcessVideosUseCase:
             audio_config: Audio configuration (codec, bitrate, channels)
             video_input_path: Root path to search for videos
             execution_threads: Number of threads to use for transcoding
+            fragmented_mp4: Write fragmented MP4 output instead of relocating the moov atom
         """
         self.video_repository = video_repository
         self.filesystem = filesystem
@@ -47,6 +49,7 @@ class ProcessVideosUseCase:
         self.audio_config = audio_config
         self.video_input_path = video_input_path
         self.execution_threads = execution_threads
+        self.fragmented_mp4 = fragmented_mp4
         self.logger = logger
         
         # Calculate target resolution and codec for validation
@@ -148,7 +151,8 @@ class ProcessVideosUseCase:
             audio_channels=audio_channels,
             audio_bitrate=self.audio_config.bitrate,
             container=ContainerFormat.MP4,
-            execution_threads=self.execution_threads
+            execution_threads=self.execution_threads,
+            fragmented_mp4=self.fragmented_mp4
         )
         
         
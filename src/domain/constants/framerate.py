@@ -24,7 +24,7 @@ class FrameRate(Enum):
     
     def to_float(self) -> float:
         """Converts the frame rate to a float value."""
-        return float(self.value)
+        return _FLOAT_VALUES[self]
     
     @classmethod
     def from_int(cls, framerate: int) -> "FrameRate":
@@ -37,21 +37,10 @@ class FrameRate(Enum):
         Returns:
             Closest FrameRate enum value, or FPS_30 as default
         """
-        if framerate <= 0:
-            return cls.FPS_30
-        
-        # Find the closest match by comparing float values
-        framerate_float = float(framerate)
-        closest = cls.FPS_30
-        min_diff = abs(framerate_float - cls.FPS_30.to_float())
-        
-        for fps in cls:
-            diff = abs(framerate_float - fps.to_float())
-            if diff < min_diff:
-                min_diff = diff
-                closest = fps
-        
-        return closest
+        # Common framerates are answered from the table precomputed at import time
+        if type(framerate) is int and 0 <= framerate < _FROM_INT_LOOKUP_SIZE:
+            return _FROM_INT_LOOKUP[framerate]
+        return _closest_framerate(framerate)
     
     @classmethod
     def get_framerate_for_light_videos(cls, original_framerate: "FrameRate") -> "FrameRate":
@@ -77,13 +66,48 @@ class FrameRate(Enum):
         Returns:
             FrameRate optimized for light videos
         """
-        conversion_map = {
-            cls.FPS_50: cls.FPS_25,
-            cls.FPS_59_94: cls.FPS_29_97,
-            cls.FPS_60: cls.FPS_30,
-            cls.FPS_120: cls.FPS_30,
-            cls.FPS_144: cls.FPS_24,
-            cls.FPS_240: cls.FPS_30,
-        }
+        return _LIGHT_VIDEO_FRAMERATES.get(original_framerate, original_framerate)
+
+
+def _closest_framerate(framerate: int) -> FrameRate:
+    """
+    Finds the closest FrameRate by comparing float values (FPS_30 on ties or invalid input).
+    
+    Args:
+        framerate: Integer framerate value
         
-        return conversion_map.get(original_framerate, original_framerate)
+    Returns:
+        Closest FrameRate enum value
+    """
+    if framerate <= 0:
+        return FrameRate.FPS_30
+    
+    framerate_float = float(framerate)
+    closest = FrameRate.FPS_30
+    min_diff = abs(framerate_float - FrameRate.FPS_30.to_float())
+    
+    for fps in FrameRate:
+        diff = abs(framerate_float - fps.to_float())
+        if diff < min_diff:
+            min_diff = diff
+            closest = fps
+    
+    return closest
+
+
+# High frame rate -> frame rate used for light videos (see get_framerate_for_light_videos)
+_LIGHT_VIDEO_FRAMERATES = {
+    FrameRate.FPS_50: FrameRate.FPS_25,
+    FrameRate.FPS_59_94: FrameRate.FPS_29_97,
+    FrameRate.FPS_60: FrameRate.FPS_30,
+    FrameRate.FPS_120: FrameRate.FPS_30,
+    FrameRate.FPS_144: FrameRate.FPS_24,
+    FrameRate.FPS_240: FrameRate.FPS_30,
+}
+
+# Float value of each frame rate, converted from its Fraction once
+_FLOAT_VALUES = {fps: float(fps.value) for fps in FrameRate}
+
+# Closest FrameRate for integer framerates 0..256 (covers every real-world video)
+_FROM_INT_LOOKUP_SIZE = 257
+_FROM_INT_LOOKUP = tuple(_closest_framerate(i) for i in range(_FROM_INT_LOOKUP_SIZE))
@@ -28,13 +28,7 @@ class HardwareBackend(str, Enum):
         Returns:
             Device path string or None if backend is NONE
         """
-        device_paths = {
-            self.QSV: "/dev/dri/renderD128",
-            self.VAAPI: "/dev/dri/renderD128",
-            self.V4L2M2M: "/dev/video10",
-            self.NONE: None,
-        }
-        return device_paths.get(self)
+        return _DEVICE_PATHS[self]
     
     @classmethod
     def from_hardware_acceleration(
@@ -50,18 +44,20 @@ class HardwareBackend(str, Enum):
         Returns:
             HardwareBackend enum value (NONE if input is None)
         """
-        if hardware_acceleration is None:
-            return cls.NONE
-        
-        # Import here to avoid circular dependencies
-        from domain.models.hardware import HardwareVideoAcceleration
-        
-        # Direct mapping since both enums have the same values
-        mapping = {
-            HardwareVideoAcceleration.QSV: cls.QSV,
-            HardwareVideoAcceleration.VAAPI: cls.VAAPI,
-            HardwareVideoAcceleration.V4L2M2M: cls.V4L2M2M,
-        }
-        
-        return mapping.get(hardware_acceleration, cls.NONE)
+        return _FROM_HW_ACCELERATION.get(hardware_acceleration, cls.NONE)
+
+
+# Device path for each hardware backend
+_DEVICE_PATHS = {
+    HardwareBackend.QSV: "/dev/dri/renderD128",
+    HardwareBackend.VAAPI: "/dev/dri/renderD128",
+    HardwareBackend.V4L2M2M: "/dev/video10",
+    HardwareBackend.NONE: None,
+}
+
+# HardwareVideoAcceleration -> HardwareBackend, keyed by value: both are str enums sharing the
+# same values, so acceleration members hash and compare equal to these keys (no import needed)
+_FROM_HW_ACCELERATION = {
+    backend.value: backend for backend in HardwareBackend if backend is not HardwareBackend.NONE
+}
 
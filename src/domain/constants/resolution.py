@@ -1,17 +1,33 @@
 """Video resolution constants and enums."""
 from enum import Enum
+from functools import lru_cache
 
 
 class VideoResolution(str, Enum):
-    """Standard video resolutions."""
-    P144 = "144p"  # 256 × 144 - Very low SD
-    P240 = "240p"  # 426 × 240 - Low SD
-    P360 = "360p"  # 640 × 360 - nHD
-    P480 = "480p"  # 854 × 480 - SD (FWVGA)
-    P720 = "720p"  # 1280 × 720 - HD
-    P1080 = "1080p"  # 1920 × 1080 - Full HD (FHD)
-    P1440 = "1440p"  # 2560 × 1440 - Quad HD (QHD / 2K)
-    P2160 = "2160p"  # 3840 × 2160 - Ultra HD / 4K
+    """Standard video resolutions (value, width, height)."""
+    P144 = ("144p", 256, 144)  # Very low SD
+    P240 = ("240p", 426, 240)  # Low SD
+    P360 = ("360p", 640, 360)  # nHD
+    P480 = ("480p", 854, 480)  # SD (FWVGA)
+    P720 = ("720p", 1280, 720)  # HD
+    P1080 = ("1080p", 1920, 1080)  # Full HD (FHD)
+    P1440 = ("1440p", 2560, 1440)  # Quad HD (QHD / 2K)
+    P2160 = ("2160p", 3840, 2160)  # Ultra HD / 4K
+    
+    def __new__(cls, value: str, width: int, height: int) -> "VideoResolution":
+        """
+        Creates a resolution member whose value is its name, storing its dimensions.
+        
+        Args:
+            value: Resolution name (e.g., '720p')
+            width: Width in pixels
+            height: Height in pixels
+        """
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.width = width  # Width in pixels
+        member.height = height  # Height in pixels
+        return member
     
     @classmethod
     def from_str(cls, value: str) -> "VideoResolution":
@@ -24,47 +40,23 @@ class VideoResolution(str, Enum):
         Returns:
             VideoResolution enum value (defaults to P480 if invalid or empty)
         """
-        if not value:
-            return cls.P480
-        
-        value_lower = value.lower().strip()
-        
-        try:
-            return cls(value_lower)
-        except ValueError:
-            return cls.P480
-    
-    @property
-    def width(self) -> int:
-        """Gets the width in pixels for this resolution."""
-        resolutions = {
-            VideoResolution.P144: 256,
-            VideoResolution.P240: 426,
-            VideoResolution.P360: 640,
-            VideoResolution.P480: 854,
-            VideoResolution.P720: 1280,
-            VideoResolution.P1080: 1920,
-            VideoResolution.P1440: 2560,
-            VideoResolution.P2160: 3840,
-        }
-        return resolutions[self]
-    
-    @property
-    def height(self) -> int:
-        """Gets the height in pixels for this resolution."""
-        resolutions = {
-            VideoResolution.P144: 144,
-            VideoResolution.P240: 240,
-            VideoResolution.P360: 360,
-            VideoResolution.P480: 480,
-            VideoResolution.P720: 720,
-            VideoResolution.P1080: 1080,
-            VideoResolution.P1440: 1440,
-            VideoResolution.P2160: 2160,
-        }
-        return resolutions[self]
+        return _resolution_from_str(value)
     
     @property
     def name(self) -> str:
         """Gets the common name of the resolution."""
         return self.value
+
+
+@lru_cache(maxsize=128)
+def _resolution_from_str(value: str) -> VideoResolution:
+    """Parses a resolution name for VideoResolution.from_str (cached per value)."""
+    if not value:
+        return VideoResolution.P480
+    
+    value_lower = value.lower().strip()
+    
+    try:
+        return VideoResolution(value_lower)
+    except ValueError:
+        return VideoResolution.P480
@@ -1,6 +1,7 @@
 """Video-related constants and enums."""
 from enum import Enum
-from typing import List, Optional, TYPE_CHECKING
+from functools import lru_cache
+from typing import FrozenSet, Optional, TYPE_CHECKING
 from domain.constants.hardware import HardwareBackend
 
 class VideoCodec(str, Enum):
@@ -24,29 +25,16 @@ class VideoCodec(str, Enum):
         Returns:
             VideoCodec enum value (defaults to H264 if invalid or empty)
         """
-        if not value:
-            return cls.H264
-        try:
-            return cls(value.lower())
-        except ValueError:
-            return cls.H264
+        return _codec_from_str(value)
     
-    def supported_profiles(self) -> List["VideoProfile"]:
+    def supported_profiles(self) -> FrozenSet["VideoProfile"]:
         """
         Gets the supported profiles for this codec.
         
         Returns:
-            List of VideoProfile enum values. Returns empty list if codec doesn't support profiles.
+            Frozenset of VideoProfile enum values. Returns empty set if codec doesn't support profiles.
         """
-        # VideoProfile is defined later in this file, so we can reference it directly
-        valid_profiles = {
-            VideoCodec.H264: [VideoProfile.BASELINE, VideoProfile.MAIN, VideoProfile.HIGH],
-            VideoCodec.HEVC: [VideoProfile.MAIN, VideoProfile.MAIN10],
-            VideoCodec.MPEG2VIDEO: [VideoProfile.SIMPLE, VideoProfile.MAIN, VideoProfile.HIGH],
-            VideoCodec.MPEG4: [VideoProfile.SIMPLE, VideoProfile.ADVANCED_SIMPLE],
-        }
-        
-        return valid_profiles.get(self, [])
+        return _SUPPORTED_PROFILES.get(self, frozenset())
     
     def supports_profile(self) -> bool:
         """
@@ -55,7 +43,7 @@ class VideoCodec(str, Enum):
         Returns:
             True if the codec supports profiles (H264, HEVC, MPEG2VIDEO, MPEG4)
         """
-        return len(self.supported_profiles()) > 0
+        return self in _SUPPORTED_PROFILES
     
     def encoder(self, hardware_backend: Optional["HardwareBackend"] = None) -> str:
         """
@@ -68,23 +56,13 @@ class VideoCodec(str, Enum):
             Encoder name string (e.g., 'libx264', 'h264_vaapi', 'h264_qsv')
         """
         
-        if hardware_backend and hardware_backend != HardwareBackend.NONE:
-            hw_encoder = HWVideoEncoder.get_encoder(self, hardware_backend)
+        if hardware_backend:
+            hw_encoder = _HW_ENCODERS.get((self, hardware_backend))
             if hw_encoder:
                 return hw_encoder.value
         
         # Software encoder (fallback or no hardware acceleration)
-        encoder_map = {
-            VideoCodec.H264: SWVideoEncoder.H264,
-            VideoCodec.HEVC: SWVideoEncoder.HEVC,
-            VideoCodec.MPEG4: SWVideoEncoder.MPEG4,
-            VideoCodec.MPEG2VIDEO: SWVideoEncoder.MPEG2VIDEO,
-            VideoCodec.VP8: SWVideoEncoder.VP8,
-            VideoCodec.VP9: SWVideoEncoder.VP9,
-            VideoCodec.AV1: SWVideoEncoder.AV1,
-        }
-        encoder = encoder_map.get(self, SWVideoEncoder.H264)  # Default to H264
-        return encoder.value
+        return _SW_ENCODERS.get(self, SWVideoEncoder.H264).value  # Default to H264
 
 
 class SWVideoEncoder(Enum):
@@ -133,36 +111,7 @@ class HWVideoEncoder(str, Enum):
         Returns:
             HWVideoEncoder enum value or None if not supported
         """
-        if hardware_backend == HardwareBackend.NONE:
-            return None
-        
-        # Import here to avoid circular dependencies
-        from domain.constants.video import VideoCodec
-        
-        # Only these codecs support hardware acceleration
-        if codec not in {VideoCodec.H264, VideoCodec.HEVC, VideoCodec.MPEG2VIDEO}:
-            return None
-        
-        # Use the mapping dictionary
-        hw_encoder_map = {
-            VideoCodec.H264: {
-                HardwareBackend.QSV: cls.H264_QSV,
-                HardwareBackend.VAAPI: cls.H264_VAAPI,
-                HardwareBackend.V4L2M2M: cls.H264_V4L2M2M,
-            },
-            VideoCodec.HEVC: {
-                HardwareBackend.QSV: cls.HEVC_QSV,
-                HardwareBackend.VAAPI: cls.HEVC_VAAPI,
-                HardwareBackend.V4L2M2M: cls.HEVC_V4L2M2M,
-            },
-            VideoCodec.MPEG2VIDEO: {
-                HardwareBackend.QSV: cls.MPEG2VIDEO_QSV,
-                HardwareBackend.VAAPI: cls.MPEG2VIDEO_VAAPI,
-                HardwareBackend.V4L2M2M: cls.MPEG2VIDEO_V4L2M2M,
-            },
-        }
-        
-        return hw_encoder_map.get(codec, {}).get(hardware_backend)
+        return _HW_ENCODERS.get((codec, hardware_backend))
 
 
 class VideoProfile(str, Enum):
@@ -190,34 +139,7 @@ class VideoProfile(str, Enum):
         Returns:
             VideoProfile enum value (defaults to codec's default profile if invalid)
         """
-        if not value:
-            return cls.get_default(codec)
-        
-        value_lower = value.lower().strip()
-        
-        # Map of codec -> valid profiles
-        valid_profiles = {
-            VideoCodec.H264: [VideoProfile.BASELINE, VideoProfile.MAIN, VideoProfile.HIGH],
-            VideoCodec.HEVC: [VideoProfile.MAIN, VideoProfile.MAIN10],
-            VideoCodec.MPEG2VIDEO: [VideoProfile.SIMPLE, VideoProfile.MAIN, VideoProfile.HIGH],
-            VideoCodec.MPEG4: [VideoProfile.SIMPLE, VideoProfile.ADVANCED_SIMPLE],
-        }
-        
-        # If codec doesn't support profiles, return None (will be handled by VideoConfig)
-        if codec not in valid_profiles:
-            return cls.get_default(codec)
-        
-        # Try to find matching profile
-        try:
-            profile = cls(value_lower)
-            # Validate it's valid for this codec
-            if profile in valid_profiles[codec]:
-                return profile
-        except ValueError:
-            pass
-        
-        # Invalid profile, return default
-        return cls.get_default(codec)
+        return _profile_from_str(value, codec)
     
     @classmethod
     def get_default(cls, codec: "VideoCodec") -> "VideoProfile":
@@ -230,10 +152,82 @@ class VideoProfile(str, Enum):
         Returns:
             Default VideoProfile for the codec, or HIGH if codec doesn't support profiles
         """
-        defaults = {
-            VideoCodec.MPEG2VIDEO: cls.MAIN,
-            VideoCodec.MPEG4: cls.SIMPLE,
-            VideoCodec.H264: cls.HIGH,
-            VideoCodec.HEVC: cls.MAIN,
-        }
-        return defaults.get(codec, cls.HIGH)
+        return _DEFAULT_PROFILES.get(codec, cls.HIGH)
+
+
+# Supported profiles for each codec (codecs without profiles have no entry)
+_SUPPORTED_PROFILES = {
+    VideoCodec.H264: frozenset({VideoProfile.BASELINE, VideoProfile.MAIN, VideoProfile.HIGH}),
+    VideoCodec.HEVC: frozenset({VideoProfile.MAIN, VideoProfile.MAIN10}),
+    VideoCodec.MPEG2VIDEO: frozenset({VideoProfile.SIMPLE, VideoProfile.MAIN, VideoProfile.HIGH}),
+    VideoCodec.MPEG4: frozenset({VideoProfile.SIMPLE, VideoProfile.ADVANCED_SIMPLE}),
+}
+
+# Default profile for each codec with profiles (others fall back to HIGH)
+_DEFAULT_PROFILES = {
+    VideoCodec.MPEG2VIDEO: VideoProfile.MAIN,
+    VideoCodec.MPEG4: VideoProfile.SIMPLE,
+    VideoCodec.H264: VideoProfile.HIGH,
+    VideoCodec.HEVC: VideoProfile.MAIN,
+}
+
+# Software encoder for each codec
+_SW_ENCODERS = {
+    VideoCodec.H264: SWVideoEncoder.H264,
+    VideoCodec.HEVC: SWVideoEncoder.HEVC,
+    VideoCodec.MPEG4: SWVideoEncoder.MPEG4,
+    VideoCodec.MPEG2VIDEO: SWVideoEncoder.MPEG2VIDEO,
+    VideoCodec.VP8: SWVideoEncoder.VP8,
+    VideoCodec.VP9: SWVideoEncoder.VP9,
+    VideoCodec.AV1: SWVideoEncoder.AV1,
+}
+
+# Hardware encoder for each (codec, backend) pair
+# Only H264, HEVC and MPEG2VIDEO support hardware acceleration; HardwareBackend.NONE has no entries
+_HW_ENCODERS = {
+    (VideoCodec.H264, HardwareBackend.QSV): HWVideoEncoder.H264_QSV,
+    (VideoCodec.H264, HardwareBackend.VAAPI): HWVideoEncoder.H264_VAAPI,
+    (VideoCodec.H264, HardwareBackend.V4L2M2M): HWVideoEncoder.H264_V4L2M2M,
+    (VideoCodec.HEVC, HardwareBackend.QSV): HWVideoEncoder.HEVC_QSV,
+    (VideoCodec.HEVC, HardwareBackend.VAAPI): HWVideoEncoder.HEVC_VAAPI,
+    (VideoCodec.HEVC, HardwareBackend.V4L2M2M): HWVideoEncoder.HEVC_V4L2M2M,
+    (VideoCodec.MPEG2VIDEO, HardwareBackend.QSV): HWVideoEncoder.MPEG2VIDEO_QSV,
+    (VideoCodec.MPEG2VIDEO, HardwareBackend.VAAPI): HWVideoEncoder.MPEG2VIDEO_VAAPI,
+    (VideoCodec.MPEG2VIDEO, HardwareBackend.V4L2M2M): HWVideoEncoder.MPEG2VIDEO_V4L2M2M,
+}
+
+
+@lru_cache(maxsize=128)
+def _codec_from_str(value: str) -> VideoCodec:
+    """Parses a codec name for VideoCodec.from_str (cached per value)."""
+    if not value:
+        return VideoCodec.H264
+    try:
+        return VideoCodec(value.lower())
+    except ValueError:
+        return VideoCodec.H264
+
+
+@lru_cache(maxsize=128)
+def _profile_from_str(value: str, codec: VideoCodec) -> VideoProfile:
+    """Parses a profile name for VideoProfile.from_str (cached per value and codec)."""
+    if not value:
+        return VideoProfile.get_default(codec)
+    
+    value_lower = value.lower().strip()
+    
+    # Codecs without profiles get the default profile (VideoConfig drops it later)
+    if codec not in _SUPPORTED_PROFILES:
+        return VideoProfile.get_default(codec)
+    
+    # Try to find matching profile
+    try:
+        profile = VideoProfile(value_lower)
+        # Validate it's valid for this codec
+        if profile in _SUPPORTED_PROFILES[codec]:
+            return profile
+    except ValueError:
+        pass
+    
+    # Invalid profile, return default
+    return VideoProfile.get_default(codec)
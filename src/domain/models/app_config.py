@@ -30,9 +30,11 @@ class VideoConfig(BaseModel):
         Returns:
             VideoConfig with corrected dimensions and profile
         """
-        # Override width and height to match resolution
-        self.width = self.resolution.width
-        self.height = self.resolution.height
+        # Override width and height to match resolution (only when they differ)
+        if self.width != self.resolution.width:
+            self.width = self.resolution.width
+        if self.height != self.resolution.height:
+            self.height = self.resolution.height
         
         # Set profile to None if codec doesn't support profiles
         if not self.codec.supports_profile():
@@ -86,8 +88,25 @@ class TranscodingConfig(BaseModel):
     execution_threads: int  # Number of execution threads
     startup_delay: int  # Delay in minutes before first execution after container startup
     execution_interval: int  # Interval in minutes between executions
+    nice_level: int = 10  # Scheduling priority increment for the process and FFmpeg (validated between 0 and 19)
+    cpu_affinity: Optional[list[int]] = None  # CPU cores allowed for the process and FFmpeg (None = all cores)
+    fragmented_mp4: bool = False  # Write fragmented MP4 output (no faststart rewrite pass)
     video: VideoConfig  # Video configuration
     audio: AudioConfig  # Audio configuration
+    
+    @field_validator('nice_level')
+    @classmethod
+    def validate_nice_level(cls, v: int) -> int:
+        """
+        Validates that nice level is between 0 and 19.
+        
+        Args:
+            v: Nice level value
+            
+        Returns:
+            Nice level clamped to valid range [0, 19]
+        """
+        return max(0, min(19, v))
 
 
 class DatabaseConfig(BaseModel):
@@ -36,6 +36,7 @@ class TranscodingConfiguration(BaseModel):
     audio_bitrate: int = Field(..., description="Audio bitrate in kbps")
     container: ContainerFormat = Field(..., description="Container format for the output video")
     execution_threads: int = Field(..., description="Number of threads to use for transcoding")
+    fragmented_mp4: bool = Field(default=False, description="Write a fragmented MP4 (moov up-front without a second rewrite pass)")
 
 
 class Transcoding(BaseModel):
@@ -1,5 +1,5 @@
 from typing import List, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from domain.constants.synology import MetadataIndex
 from domain.constants.video import VideoCodec
 from domain.constants.audio import AudioCodec
@@ -14,6 +14,15 @@ class VideoTrack(BaseModel):
     profile: str = Field(default="", description="Codec profile")
     framerate: int = Field(..., description="Frames per second")
     bitrate: float = Field(default=0.0, description="Video bitrate")
+    source_codec_name: str = Field(default="", description="Codec name as reported by the metadata, before normalization")
+    
+    @model_validator(mode='before')
+    @classmethod
+    def keep_source_codec(cls, data: Any) -> Any:
+        """Keeps the reported codec name, since codec_name falls back to h264 for unknown codecs."""
+        if isinstance(data, dict) and "source_codec_name" not in data:
+            data = {**data, "source_codec_name": str(data.get("codec_name") or "").strip().lower()}
+        return data
     
     @field_validator('codec_name')
     @classmethod
@@ -15,7 +15,7 @@ from domain.models.app_config import (
 from domain.constants.video import VideoCodec, VideoProfile
 from domain.constants.resolution import VideoResolution
 from domain.constants.audio import AudioCodec
-from infrastructure.utils import to_int
+from infrastructure.utils import to_int, to_cpu_list
 
 
 class Config:
@@ -78,6 +78,9 @@ class Config:
         logger.info(f"  - Execution threads: {self.transcoding.execution_threads}")
         logger.info(f"  - Startup delay: {self.transcoding.startup_delay} minutes")
         logger.info(f"  - Execution interval: {self.transcoding.execution_interval} minutes")
+        logger.info(f"  - Fragmented MP4: {self.transcoding.fragmented_mp4}")
+        affinity_str = ",".join(map(str, self.transcoding.cpu_affinity)) if self.transcoding.cpu_affinity else "all"
+        logger.info(f"  - Process priority: nice {self.transcoding.nice_level}, CPU cores {affinity_str}")
         profile_str = f" ({self.transcoding.video.profile.value})" if self.transcoding.video.profile else ""
         logger.info(
             f"  - Video: {self.transcoding.video.resolution.name} "
@@ -159,6 +162,9 @@ class Config:
         execution_threads = to_int(os.getenv("EXECUTION_THREADS"), default=2)
         startup_delay = to_int(os.getenv("STARTUP_DELAY"), default=30)  # Default 30 minutes
         execution_interval = to_int(os.getenv("EXECUTION_INTERVAL"), default=240)  # Default 4 hours
+        nice_level = to_int(os.getenv("NICE_LEVEL"), default=10)
+        cpu_affinity = to_cpu_list(os.getenv("CPU_AFFINITY"))
+        fragmented_mp4 = os.getenv("FRAGMENTED_MP4", "False").lower() in ("true", "1", "yes")
         
         # Video configuration
         video_codec_raw = os.getenv("VIDEO_CODEC", "h264")
@@ -228,6 +234,9 @@ class Config:
             execution_threads=execution_threads,
             startup_delay=startup_delay,
             execution_interval=execution_interval,
+            nice_level=nice_level,
+            cpu_affinity=cpu_affinity,
+            fragmented_mp4=fragmented_mp4,
             video=video_config,
             audio=audio_config
         )
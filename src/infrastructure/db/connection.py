@@ -1,6 +1,8 @@
 """Database connection management."""
 import os
+from typing import Optional
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -13,20 +15,23 @@ Base = declarative_base()
 class DatabaseConnection:
     """Manages database connection."""
     
-    def __init__(self, db_config: DatabaseConfig, logger: AppLogger):
+    def __init__(self, db_config: DatabaseConfig, logger: AppLogger, engine: Optional[Engine] = None):
         """
         Initializes database connection.
 
         Args:
             db_config: Database configuration object
             logger: Application logger
+            engine: Existing SQLAlchemy engine to use instead of creating one from db_config (optional)
         """
         self.config = db_config
         self.logger = logger
-        self.engine = create_engine(
-            f"sqlite:///{db_config.path}",
-            connect_args={"check_same_thread": False}
-        )
+        if engine is None:
+            engine = create_engine(
+                f"sqlite:///{db_config.path}",
+                connect_args={"check_same_thread": False}
+            )
+        self.engine = engine
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
     
     def is_empty(self) -> bool:
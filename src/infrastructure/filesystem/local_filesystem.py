@@ -1,74 +1,301 @@
 """Local filesystem implementation."""
+import json
 import os
-import glob
-from typing import List, Optional
-from pathlib import Path
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from domain.ports.filesystem import Filesystem
 
 
+# Synology system directories (thumbnails/transcodes, recycle bin) never scanned for videos
+EXCLUDED_DIRS = frozenset({'@eaDir', '#recycle'})
+
+# Synology transcoded files in an @eaDir/<video>/ directory, in order of preference
+TRANSCODED_VIDEO_NAMES = ('SYNOPHOTO_FILM_M.mp4', 'SYNOPHOTO_FILM_H.mp4')
+
+# Bump when the scan cache layout changes (older caches are then ignored)
+SCAN_CACHE_VERSION = 1
+
+# Directories modified this recently may still change within the same mtime tick (coarse
+# timestamps on FAT/SMB/NFS), so their listings are not cached ("racy" entries)
+SCAN_CACHE_MTIME_GRANULARITY_NS = 2_000_000_000
+
+# Threads used to scan top-level subdirectories in parallel (the scan is I/O-bound)
+SCAN_MAX_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+# Bytes requested per os.read() in read_file
+READ_CHUNK_SIZE = 64 * 1024
+
+
 class LocalFilesystem(Filesystem):
     """Local filesystem implementation."""
     
-    def __init__(self, video_extensions: List[str]):
+    def __init__(self, video_extensions: List[str], cache_path: Optional[str] = None):
         """
         Initializes the filesystem.
         
         Args:
             video_extensions: List of video file extensions to search for
+            cache_path: JSON file used to cache directory listings between scans (optional).
+                A directory is only re-read when its mtime has changed.
         """
         self.video_extensions = video_extensions
+        self.cache_path = cache_path
+        # Lowercased suffixes (with leading dot) for O(1) extension checks; accepts "mp4" or ".MP4"
+        self._extension_suffixes = frozenset(
+            f".{extension.lower().lstrip('.')}" for extension in video_extensions
+        )
+        # dir path -> [mtime_ns, video names, subdirectory names]; loaded on first scan
+        self._scan_cache: Optional[Dict[str, list]] = None
     
     def find_videos(self, directory: str) -> List[str]:
         """Finds all video files in a directory and subdirectories."""
         if not os.path.isdir(directory):
             return []
         
+        if self.cache_path is not None and self._scan_cache is None:
+            self._scan_cache = self._load_scan_cache()
+        previous_cache = self._scan_cache
+        current_cache = {} if previous_cache is not None else None
+        
+        try:
+            dir_stat = os.stat(directory)
+            video_names, subdir_names = self._list_directory(directory, dir_stat, previous_cache, current_cache)
+        except OSError:
+            return []
+        video_files = [os.path.join(directory, name) for name in video_names]
+        subtrees = [os.path.join(directory, name) for name in subdir_names]
+        ancestors = frozenset({(dir_stat.st_dev, dir_stat.st_ino)})
+        
+        # Independent subtrees are walked in parallel; threads overlap the directory-read latency
+        if len(subtrees) < 2:
+            walks = [self._walk_tree(subtree, ancestors, previous_cache) for subtree in subtrees]
+        else:
+            with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, len(subtrees))) as executor:
+                walks = list(executor.map(
+                    lambda subtree: self._walk_tree(subtree, ancestors, previous_cache), subtrees
+                ))
+        
+        for subtree_videos, subtree_cache in walks:
+            video_files.extend(subtree_videos)
+            if current_cache is not None:
+                current_cache.update(subtree_cache)
+        
+        if current_cache is not None:
+            # Keep entries of other scan roots; drop directories of this tree that are gone
+            merged_cache = {
+                path: value for path, value in previous_cache.items()
+                if path != directory and not path.startswith(os.path.join(directory, ''))
+            }
+            merged_cache.update(current_cache)
+            if merged_cache != previous_cache:
+                self._scan_cache = merged_cache
+                self._save_scan_cache(merged_cache)
+        
+        return sorted(video_files)
+    
+    def _walk_tree(
+        self,
+        root: str,
+        ancestors: FrozenSet[Tuple[int, int]],
+        previous_cache: Optional[Dict[str, list]]
+    ) -> Tuple[List[str], Dict[str, list]]:
+        """
+        Walks one directory tree iteratively and collects its video files.
+        
+        Symlinked directories are followed (like glob). A directory whose (st_dev, st_ino)
+        is already one of its own ancestors is a symlink loop and is not entered again.
+        
+        Args:
+            root: Directory to walk
+            ancestors: (st_dev, st_ino) of the directories above root
+            previous_cache: Scan cache to reuse listings from (None if caching is disabled)
+            
+        Returns:
+            Tuple of (video file paths, scan cache entries for the walked directories)
+        """
         video_files = []
-        for extension in self.video_extensions:
-            pattern = os.path.join(directory, '**', f'*.{extension}')
-            video_files.extend(glob.iglob(pattern, recursive=True))
+        current_cache = {} if previous_cache is not None else None
+        pending_dirs = [(root, ancestors)]
+        while pending_dirs:
+            dir_path, dir_ancestors = pending_dirs.pop()
+            try:
+                dir_stat = os.stat(dir_path)
+                dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+                if dir_key in dir_ancestors:
+                    continue
+                video_names, subdir_names = self._list_directory(dir_path, dir_stat, previous_cache, current_cache)
+            except OSError:
+                continue
+            video_files.extend(os.path.join(dir_path, name) for name in video_names)
+            if subdir_names:
+                subdir_ancestors = dir_ancestors | {dir_key}
+                pending_dirs.extend((os.path.join(dir_path, name), subdir_ancestors) for name in subdir_names)
+        return video_files, current_cache or {}
+    
+    def _list_directory(
+        self,
+        dir_path: str,
+        dir_stat: os.stat_result,
+        previous_cache: Optional[Dict[str, list]],
+        current_cache: Optional[Dict[str, list]]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Lists a directory, reusing the cached listing if its mtime has not changed.
+        
+        Args:
+            dir_path: Directory to list
+            dir_stat: os.stat() result of the directory
+            previous_cache: Scan cache to reuse listings from (None if caching is disabled)
+            current_cache: Scan cache being built, updated with this directory (None if disabled)
+            
+        Returns:
+            Tuple of (video file names, subdirectory names)
+            
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        if current_cache is None:
+            return self._scan_directory(dir_path)
         
-        # Filter out files in @eaDir and #recycle (Synology directories)
-        original_video_files = [
-            video_path for video_path in video_files
-            if '@eaDir' not in video_path and '#recycle' not in video_path
-        ]
+        # A directory's mtime changes when entries are added, removed or renamed
+        mtime = dir_stat.st_mtime_ns
+        cached = previous_cache.get(dir_path)
+        if cached is not None and cached[0] == mtime:
+            video_names, subdir_names = cached[1], cached[2]
+        else:
+            scanned_at = time.time_ns()
+            video_names, subdir_names = self._scan_directory(dir_path)
+            # An entry added later in the same mtime tick would not change the mtime: only
+            # cache listings of directories that were already stable when they were read
+            if scanned_at - mtime < SCAN_CACHE_MTIME_GRANULARITY_NS:
+                return video_names, subdir_names
+        current_cache[dir_path] = [mtime, video_names, subdir_names]
+        return video_names, subdir_names
+    
+    def _scan_directory(self, dir_path: str) -> Tuple[List[str], List[str]]:
+        """
+        Lists the video files and subdirectories to descend into of one directory.
+        
+        File types come from the directory entries (no extra stat() per entry, except for symlinks).
+        Hidden entries are skipped (same as glob) and Synology directories are pruned.
         
-        return sorted(original_video_files)
+        Args:
+            dir_path: Directory to read
+            
+        Returns:
+            Tuple of (video file names, subdirectory names)
+            
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        video_names = []
+        subdir_names = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+                # Follows symlinked directories (albums are often linked into a share)
+                if entry.is_dir():
+                    if name not in EXCLUDED_DIRS:
+                        subdir_names.append(name)
+                    continue
+                dot = name.rfind('.')
+                if dot > 0 and name[dot:].lower() in self._extension_suffixes and entry.is_file():
+                    video_names.append(name)
+        return video_names, subdir_names
+    
+    def _load_scan_cache(self) -> Dict[str, list]:
+        """Loads the scan cache from cache_path (empty cache if missing, invalid or outdated)."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != SCAN_CACHE_VERSION:
+            return {}
+        directories = data.get("directories")
+        if not isinstance(directories, dict):
+            return {}
+        # Drop malformed entries (truncated or hand-edited file): those directories are rescanned
+        return {
+            path: entry for path, entry in directories.items()
+            if _is_scan_cache_entry(entry)
+        }
+    
+    def _save_scan_cache(self, cache: Dict[str, list]) -> None:
+        """Writes the scan cache atomically (temporary file + rename); failures are ignored."""
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": SCAN_CACHE_VERSION, "directories": cache}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
     
     def file_exists(self, path: str) -> bool:
         """Checks if a file exists."""
         return os.path.isfile(path)
 
     def read_file(self, path: str) -> Optional[str]:
-        """Reads file contents, returns None if file does not exist."""
-        if not os.path.isfile(path):
+        """Reads file contents, returns None if it is missing, not a regular file or unreadable."""
+        # Raw fd reads: these are small metadata files, not worth a TextIOWrapper.
+        # O_NONBLOCK keeps the open from hanging on a FIFO; only regular files are read.
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError:
             return None
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception:
+            if not stat.S_ISREG(os.fstat(fd).st_mode):
+                return None
+            chunks = []
+            while True:
+                chunk = os.read(fd, READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            return b"".join(chunks).decode('utf-8')
+        except (OSError, UnicodeDecodeError):
             return None
+        finally:
+            os.close(fd)
 
     def ensure_directory(self, path: str) -> None:
         """Ensures directory exists, creating parents if needed."""
+        # Usually already there: one stat() instead of makedirs' walk over the ancestors
+        if os.path.isdir(path):
+            return
         os.makedirs(path, exist_ok=True)
     
     def find_transcoded_video(self, original_video_path: str) -> str:
         """Finds the transcoded video file associated with an original video."""
-        video_file = Path(original_video_path)
-        ea_dir = video_file.parent / '@eaDir' / video_file.name
+        ea_dir = os.path.join(os.path.dirname(original_video_path), '@eaDir', os.path.basename(original_video_path))
         
-        if not ea_dir.exists():
+        # One directory read instead of a stat() per candidate name
+        try:
+            with os.scandir(ea_dir) as entries:
+                available = {entry.name for entry in entries}
+        except OSError:
             return ""
         
-        # Look for common Synology transcoded files
-        transcoded_names = ['SYNOPHOTO_FILM_M.mp4', 'SYNOPHOTO_FILM_H.mp4']
-        
-        for name in transcoded_names:
-            transcoded_path = ea_dir / name
-            if transcoded_path.exists():
-                return str(transcoded_path)
+        for name in TRANSCODED_VIDEO_NAMES:
+            if name in available:
+                return os.path.join(ea_dir, name)
         
         return ""
+
+
+def _is_scan_cache_entry(entry) -> bool:
+    """Checks a scan cache entry has the [mtime_ns, video names, subdirectory names] layout."""
+    return (
+        isinstance(entry, list)
+        and len(entry) == 3
+        and type(entry[0]) is int
+        and all(
+            isinstance(names, list) and all(isinstance(name, str) for name in names)
+            for names in entry[1:]
+        )
+    )
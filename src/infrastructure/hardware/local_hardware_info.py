@@ -1,5 +1,7 @@
 """Local hardware information implementation."""
-import cpuinfo
+import os
+import platform
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -7,11 +9,22 @@ from domain.models.hardware import CPUInfo, CPUVendor, HardwareVideoAcceleration
 from domain.ports.hardware_info import HardwareInfo
 
 HW_ACCELERATION_DEVICE_PATH = "/dev/dri/renderD128"
+PROC_CPUINFO_PATH = "/proc/cpuinfo"
+
+# Exact (lowercased) vendor_id strings reported by the kernel / py-cpuinfo
+CPU_VENDOR_IDS = {
+    'genuineintel': CPUVendor.INTEL,
+    'authenticamd': CPUVendor.AMD,
+    'arm': CPUVendor.ARM,
+}
 
 
 class LocalHardwareInfo(HardwareInfo):
     """
     Local hardware information implementation.
+    
+    Detection results are cached process-wide (hardware does not change at runtime),
+    so every instance after the first one is free.
     """
 
     def __init__(self):
@@ -39,85 +52,158 @@ class LocalHardwareInfo(HardwareInfo):
             self._video_acceleration = self._detect_video_acceleration()
         return self._video_acceleration
     
-   
     def _get_cpu_info(self) -> CPUInfo:
         """
-        Gets CPU information using py-cpuinfo, caching the result to avoid multiple calls.
-        
-        Detects:
-        - CPU vendor (Intel, AMD, ARM, or Unknown)
-        - CPU name/brand
-        - CPU architecture
-        - Number of CPU cores
+        Gets CPU information (detected once per process).
         """
-        if self._cpu_info is None:
-            try:
-                raw_cpu_info = cpuinfo.get_cpu_info()
-            except Exception:
-                # Use default values from CPUInfo model
-                self._cpu_info = CPUInfo()
-                return self._cpu_info
-            else:
-                arch = raw_cpu_info.get('arch', 'unknown')
-                name = raw_cpu_info.get('brand_raw', 'unknown')
-                vendor = self._get_cpu_vendor(
-                    arch=arch.lower(),
-                    vendor_id=raw_cpu_info.get('vendor_id_raw', '').lower(),
-                    name=name.lower()
-                )
-                self._cpu_info = CPUInfo(
-                    vendor=vendor,
-                    name=name,
-                    arch=arch,
-                    cores=self._get_cpu_cores(raw_cpu_info)
-                )
-                return self._cpu_info
-        
-        return self._cpu_info
+        return _detect_cpu_info()
     
-    def _get_cpu_vendor(self, arch: str, vendor_id: str, name: str) -> CPUVendor:
+    def _detect_video_acceleration(self) -> Optional[HardwareVideoAcceleration]:
         """
-        Detects the CPU vendor.
+        Detects the hardware video acceleration method (once per process and vendor).
         """
-        # Detect Intel
-        if 'intel' in vendor_id or 'intel' in name or 'genuineintel' in vendor_id:
-            return CPUVendor.INTEL
-        
-        # Detect AMD
-        if 'amd' in vendor_id or 'amd' in name or 'authenticamd' in vendor_id:
-            return CPUVendor.AMD
-        
-        # Detect ARM
-        if 'arm' in arch or 'aarch64' in arch or 'arm' in vendor_id or 'arm' in name:
-            return CPUVendor.ARM
+        return _detect_video_acceleration(self.cpu.vendor)
+
+
+def _fast_cpu_probe(path: str = PROC_CPUINFO_PATH) -> Optional[dict]:
+    """
+    Reads the CPU fields we need straight from /proc/cpuinfo.
+    
+    Much cheaper than py-cpuinfo's full probe. Returns a dict with the same keys
+    py-cpuinfo uses, or None if the file is unavailable or has no model name
+    (e.g. many ARM kernels), so the caller can fall back to py-cpuinfo.
+    
+    Args:
+        path: Path of the cpuinfo file
         
-        return CPUVendor.UNKNOWN
+    Returns:
+        Dict with vendor_id_raw, brand_raw, arch and count, or None
+    """
+    fields = {}
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                # Only the first processor block is needed
+                if not line.strip():
+                    break
+                key, sep, value = line.partition(':')
+                if sep:
+                    fields.setdefault(key.strip(), value.strip())
+    except OSError:
+        return None
     
-    def _get_cpu_cores(self, raw_cpu_info: dict) -> int:
-        """
-        Detects the number of CPU cores from CPU information.
-        """
-        try:
-            # Try different keys that py-cpuinfo might use
-            cores = raw_cpu_info.get('count', raw_cpu_info.get('cpu_count', raw_cpu_info.get('cores', 1)))
-            return cores if isinstance(cores, int) else 1
-        except Exception:
-            return 1
+    brand = fields.get('model name')
+    if not brand:
+        return None
     
+    return {
+        'vendor_id_raw': fields.get('vendor_id', ''),
+        'brand_raw': brand,
+        'arch': platform.machine() or 'unknown',
+        'count': os.cpu_count() or 1,
+    }
+
+
+@lru_cache(maxsize=1)
+def _detect_cpu_info() -> CPUInfo:
+    """
+    Gets CPU information from /proc/cpuinfo, falling back to py-cpuinfo.
     
-    def _detect_video_acceleration(self) -> Optional[HardwareVideoAcceleration]:
-        """
-        Detects the hardware video acceleration method based on CPU vendor.
-        
-        For Intel and AMD, also verifies that the DRI device exists at 
-        /dev/dri/renderD128. If the device doesn't exist, returns None.
-        """
+    Detects:
+    - CPU vendor (Intel, AMD, ARM, or Unknown)
+    - CPU name/brand
+    - CPU architecture
+    - Number of CPU cores
+    """
+    try:
+        raw_cpu_info = _fast_cpu_probe()
+        if raw_cpu_info is None:
+            # Imported here: py-cpuinfo is slow to import and rarely needed
+            import cpuinfo
+            raw_cpu_info = cpuinfo.get_cpu_info()
+    except Exception:
+        # Use default values from CPUInfo model
+        return CPUInfo()
 
-        preferred_acceleration = VENDOR_TO_VIDEO_ACCELERATION.get(self.cpu.vendor)
-        
-        if self.cpu.vendor in (CPUVendor.INTEL, CPUVendor.AMD):
-            if not Path(HW_ACCELERATION_DEVICE_PATH).exists():
-                return None
+    arch = raw_cpu_info.get('arch', 'unknown')
+    name = raw_cpu_info.get('brand_raw', 'unknown')
+    vendor = _get_cpu_vendor(
+        arch=arch.lower(),
+        vendor_id=raw_cpu_info.get('vendor_id_raw', '').lower(),
+        name=name.lower()
+    )
+    return CPUInfo(
+        vendor=vendor,
+        name=name,
+        arch=arch,
+        cores=_get_cpu_cores(raw_cpu_info)
+    )
+
+
+def _get_cpu_vendor(arch: str, vendor_id: str, name: str) -> CPUVendor:
+    """
+    Detects the CPU vendor.
+    """
+    # Fast path: well-known vendor ids resolve with a single lookup
+    vendor = CPU_VENDOR_IDS.get(vendor_id)
+    if vendor is not None:
+        return vendor
+    
+    # Fallback: vendor hints in the vendor id, brand name or architecture
+    if 'intel' in vendor_id or 'intel' in name:
+        return CPUVendor.INTEL
+    if 'amd' in vendor_id or 'amd' in name:
+        return CPUVendor.AMD
+    if 'arm' in arch or 'aarch64' in arch or 'arm' in vendor_id or 'arm' in name:
+        return CPUVendor.ARM
+    
+    return CPUVendor.UNKNOWN
+
+
+def _get_cpu_cores(raw_cpu_info: dict) -> int:
+    """
+    Detects the number of CPU cores from CPU information.
+    """
+    try:
+        # Try different keys that py-cpuinfo might use
+        cores = raw_cpu_info.get('count', raw_cpu_info.get('cpu_count', raw_cpu_info.get('cores', 1)))
+        return cores if isinstance(cores, int) else 1
+    except Exception:
+        return 1
+
+
+@lru_cache(maxsize=None)
+def _detect_video_acceleration(vendor: CPUVendor) -> Optional[HardwareVideoAcceleration]:
+    """
+    Detects the hardware video acceleration method based on CPU vendor.
+    
+    For Intel and AMD, also verifies that the DRI device exists at 
+    /dev/dri/renderD128. If the device doesn't exist, returns None.
+    """
+    preferred_acceleration = VENDOR_TO_VIDEO_ACCELERATION.get(vendor)
+    
+    if vendor in (CPUVendor.INTEL, CPUVendor.AMD):
+        if not has_hw_acceleration_device():
+            return None
+
+    return preferred_acceleration
+
+
+@lru_cache(maxsize=1)
+def has_hw_acceleration_device() -> bool:
+    """
+    Checks whether the DRI render node exists (checked once per process).
+    
+    DRI devices do not appear or disappear while the container is running.
+    
+    Returns:
+        True if /dev/dri/renderD128 exists
+    """
+    return Path(HW_ACCELERATION_DEVICE_PATH).exists()
 
-        return preferred_acceleration
 
+def clear_hardware_cache() -> None:
+    """Clears the process-wide hardware detection cache (forces re-detection)."""
+    _detect_cpu_info.cache_clear()
+    _detect_video_acceleration.cache_clear()
+    has_hw_acceleration_device.cache_clear()
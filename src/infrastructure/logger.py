@@ -1,6 +1,7 @@
 """Logger configuration."""
-import inspect
 import logging
+import sys
+import threading
 from typing import Optional
 
 from domain.ports.logger import AppLogger
@@ -17,21 +18,30 @@ class EnhancedLogger(AppLogger):
             logger: Standard logging.Logger instance
         """
         self._logger = logger
+        # Bind the logging calls straight to the underlying logger (one Python frame less per call)
+        self.debug = logger.debug
+        self.info = logger.info
+        self.warning = logger.warning
+        self.error = logger.error
+        self.exception = logger.exception
 
     def __getattr__(self, name):
         """Delegates all other attributes to the underlying logger."""
         return getattr(self._logger, name)
 
+    # info/warning/error below exist only to implement the AppLogger abstract methods:
+    # instances never reach them, __init__ binds the underlying logger's methods instead
+
     def info(self, msg: str, *args, **kwargs) -> None:
-        """Logs an informational message."""
+        """Logs an informational message (shadowed by the bound method set in __init__)."""
         self._logger.info(msg, *args, **kwargs)
 
     def warning(self, msg: str, *args, **kwargs) -> None:
-        """Logs a warning message."""
+        """Logs a warning message (shadowed by the bound method set in __init__)."""
         self._logger.warning(msg, *args, **kwargs)
 
     def error(self, msg: str, *args, **kwargs) -> None:
-        """Logs an error message."""
+        """Logs an error message (shadowed by the bound method set in __init__)."""
         self._logger.error(msg, *args, **kwargs)
 
     def title(self, text: str, char: str = "=") -> None:
@@ -65,6 +75,8 @@ class Logger:
     """Logger utility class."""
     
     _enhanced_loggers: dict[str, EnhancedLogger] = {}
+    # Serializes cache misses so there is one EnhancedLogger per name, even with concurrent first calls
+    _enhanced_loggers_lock = threading.Lock()
     _root_logger_configured: bool = False
     
     @staticmethod
@@ -131,21 +143,9 @@ class Logger:
         # If no name provided, try to auto-detect or use config/default
         if not name:
             try:
-                # Get the frame of the caller (skip this method and get_logger)
-                frame = inspect.currentframe()
-                if frame:
-                    caller_frame = frame.f_back
-                    if caller_frame:
-                        # Get the module name from the caller's frame
-                        module = inspect.getmodule(caller_frame)
-                        if module and module.__name__:
-                            name = module.__name__
-                        else:
-                            # Fallback: use filename if module not available
-                            filename = caller_frame.f_globals.get('__name__', None)
-                            if filename:
-                                name = filename
-            except Exception:
+                # Module name of the caller's frame (direct frame access, no module lookup)
+                name = sys._getframe(1).f_globals.get('__name__')
+            except (AttributeError, ValueError):
                 pass
             
             # If auto-detection failed, use default
@@ -154,7 +154,16 @@ class Logger:
         
         # Use logger name as cache key - each module gets its own EnhancedLogger
         # but all share the same underlying configuration
-        if name not in Logger._enhanced_loggers:
+        cached = Logger._enhanced_loggers.get(name)
+        if cached is not None:
+            return cached
+        
+        with Logger._enhanced_loggers_lock:
+            # Re-check: a concurrent first call may have created it while we waited for the lock
+            cached = Logger._enhanced_loggers.get(name)
+            if cached is not None:
+                return cached
+            
             # Get logger - it will inherit handlers from root
             logger = logging.getLogger(name)
             
@@ -166,6 +175,6 @@ class Logger:
             logger.setLevel(level_int)
             
             # Cache the EnhancedLogger instance for this name
-            Logger._enhanced_loggers[name] = EnhancedLogger(logger)
-        
-        return Logger._enhanced_loggers[name]
+            enhanced_logger = EnhancedLogger(logger)
+            Logger._enhanced_loggers[name] = enhanced_logger
+            return enhanced_logger
@@ -4,6 +4,49 @@ import shutil
 from typing import List, Optional
 
 
+# Encoder name suffixes that identify hardware codecs in "ffmpeg -encoders" output
+HW_CODEC_MARKERS = ("_qsv", "_vaapi", "_v4l2m2m", "_nvenc")
+
+
+def parse_hw_encoder_list(stdout: str) -> List[str]:
+    """
+    Parses "ffmpeg -encoders" output into the hardware encoder names it lists.
+    
+    Args:
+        stdout: Output of "ffmpeg -hide_banner -encoders"
+        
+    Returns:
+        Hardware codec names in order of appearance, without duplicates
+    """
+    codecs = {}
+    for line in stdout.splitlines():
+        # Line format: " V..... h264_qsv           Intel QSV H.264 encoder"
+        if any(marker in line for marker in HW_CODEC_MARKERS):
+            parts = line.split()
+            if len(parts) >= 2:
+                codecs[parts[1]] = None
+    return list(codecs)
+
+
+def parse_hwaccel_list(stdout: str) -> List[str]:
+    """
+    Parses "ffmpeg -hwaccels" output into hardware acceleration method names.
+    
+    Args:
+        stdout: Output of "ffmpeg -hide_banner -hwaccels"
+        
+    Returns:
+        Hardware acceleration method names (header and blank lines skipped)
+    """
+    hwaccels = []
+    for line in stdout.splitlines():
+        line = line.strip()
+        if not line or line.lower().startswith("hardware acceleration methods"):
+            continue
+        hwaccels.append(line)
+    return hwaccels
+
+
 def get_available_hw_codecs() -> List[str]:
     """
     Gets the list of hardware-accelerated codecs available in FFmpeg.
@@ -25,18 +68,7 @@ def get_available_hw_codecs() -> List[str]:
         if result.returncode != 0:
             return []
         
-        codecs = []
-        for line in result.stdout.splitlines():
-            # Line format: " V..... h264_qsv           Intel QSV H.264 encoder"
-            # Look for hardware codecs (usually contain _qsv, _vaapi, _v4l2m2m, _nvenc)
-            if any(marker in line for marker in ["_qsv", "_vaapi", "_v4l2m2m", "_nvenc"]):
-                parts = line.split()
-                if len(parts) >= 2:
-                    codec_name = parts[1]
-                    if codec_name not in codecs:
-                        codecs.append(codec_name)
-        
-        return codecs
+        return parse_hw_encoder_list(result.stdout)
     except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
         return []
 
@@ -62,14 +94,7 @@ def get_available_hwaccels() -> List[str]:
         if result.returncode != 0:
             return []
         
-        hwaccels = []
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if not line or line.lower().startswith("hardware acceleration methods"):
-                continue
-            hwaccels.append(line)
-        
-        return hwaccels
+        return parse_hwaccel_list(result.stdout)
     except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
         return []
 
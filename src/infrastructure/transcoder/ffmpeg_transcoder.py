@@ -1,6 +1,5 @@
 """FFmpeg transcoder implementation."""
 import subprocess
-import shutil
 from typing import List, Optional
 
 from domain.ports.transcoder import Transcoder
@@ -13,10 +12,32 @@ from domain.constants.audio import AudioCodec
 from domain.ports.logger import AppLogger
 
 
+# MP4 muxer flags: faststart relocates the moov atom with a second pass over the output,
+# fragmented MP4 writes an empty moov up-front and needs no rewrite
+FASTSTART_MOVFLAGS = "+faststart"
+FRAGMENTED_MOVFLAGS = "+frag_keyframe+empty_moov+default_base_moof"
+
+# Number of trailing ffmpeg stderr lines logged when a transcoding fails
+FFMPEG_ERROR_TAIL_LINES = 20
+
+# V4L2M2M hardware decoders by input codec (other codecs use FFmpeg's default decoder)
+V4L2M2M_DECODERS = {
+    VideoCodec.H264.value: "h264_v4l2m2m",
+    VideoCodec.HEVC.value: "hevc_v4l2m2m",
+}
+
+
 class FFmpegTranscoder(Transcoder):
     """FFmpeg-based transcoder implementation for a specific video transcoding."""
     
-    def __init__(self, transcoding: Transcoding, hardware_info: HardwareInfo, logger: AppLogger):
+    def __init__(
+        self,
+        transcoding: Transcoding,
+        hardware_info: HardwareInfo,
+        logger: AppLogger,
+        hardware_backend: Optional[HardwareBackend] = None,
+        ffmpeg_path: str = "ffmpeg"
+    ):
         """
         Initializes the FFmpeg transcoder for a specific video transcoding.
 
@@ -24,16 +45,20 @@ class FFmpegTranscoder(Transcoder):
             transcoding: Transcoding object containing all necessary information
             hardware_info: Hardware information to determine acceleration method
             logger: Application logger
+            hardware_backend: Hardware backend already resolved by the factory (optional,
+                derived from hardware_info when not provided)
+            ffmpeg_path: Path to the ffmpeg executable (resolved once by the factory)
         """
 
         self.transcoding: Transcoding = transcoding
         self.hardware_info: HardwareInfo = hardware_info
         self.logger: AppLogger = logger
+        self.ffmpeg_path: str = ffmpeg_path
         
-        # Convert HardwareVideoAcceleration to HardwareBackend
-        self.hardware_backend: HardwareBackend = HardwareBackend.from_hardware_acceleration(
-            hardware_info.video_acceleration
-        )
+        # Convert HardwareVideoAcceleration to HardwareBackend (unless the factory already did)
+        if hardware_backend is None:
+            hardware_backend = HardwareBackend.from_hardware_acceleration(hardware_info.video_acceleration)
+        self.hardware_backend: HardwareBackend = hardware_backend
         
         # Get video encoder (already handles hardware vs software)
         self.video_encoder: str = transcoding.configuration.video_codec.encoder(
@@ -42,6 +67,16 @@ class FFmpegTranscoder(Transcoder):
         
         # Get audio encoder
         self.audio_encoder: str = transcoding.configuration.audio_codec.encoder()
+        
+        # Precompute argument values shared by the command builders
+        config = transcoding.configuration
+        self._device_path: Optional[str] = self.hardware_backend.device_path()
+        self._video_bitrate: str = f"{config.video_bitrate}k"
+        self._video_bufsize: str = f"{config.video_bitrate * 2}k"
+        self._video_framerate: str = str(int(config.video_framerate))
+        self._audio_bitrate: str = f"{config.audio_bitrate}k"
+        self._threads: str = str(config.execution_threads)
+        self._movflags: str = FRAGMENTED_MOVFLAGS if config.fragmented_mp4 else FASTSTART_MOVFLAGS
    
     
     def transcode(self) -> bool:
@@ -51,22 +86,29 @@ class FFmpegTranscoder(Transcoder):
         Returns:
             True if transcoding succeeded, False otherwise
         """
-        if not shutil.which("ffmpeg"):
-            return False
-        
         # Build ffmpeg command using internal configuration
         cmd = self._build_ffmpeg_command()
         
         try:
+            # ffmpeg never reads stdin nor writes useful data to stdout, so only stderr is captured.
+            # Keep the absolute executable path (cmd[0]) and avoid preexec_fn, pass_fds, cwd or
+            # new sessions: that lets CPython launch ffmpeg through posix_spawn instead of fork+exec.
             result = subprocess.run(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
+                close_fds=True,
                 check=True
             )
             return result.returncode == 0
         except subprocess.CalledProcessError as e:
-            error_output = e.stderr.decode('utf-8', errors='replace') if e.stderr else "No error output available"
+            # Only the end of stderr explains the failure: decode and log just the last lines
+            if e.stderr:
+                error_tail = e.stderr.rstrip().splitlines()[-FFMPEG_ERROR_TAIL_LINES:]
+                error_output = b"\n".join(error_tail).decode('utf-8', errors='replace')
+            else:
+                error_output = "No error output available"
             self.logger.warning(f"FFmpeg transcoding failed for {self.transcoding.original_video.path}:")
             self.logger.warning(error_output)
             return False
@@ -81,171 +123,138 @@ class FFmpegTranscoder(Transcoder):
         - V4L2M2M (Video4Linux2 Memory-to-Memory for ARM)
         - Software (no hardware acceleration)
         """
-        cmd = ["ffmpeg", "-hide_banner", "-y"]
-        
         # Build video-specific command based on hardware backend
         if self.hardware_backend == HardwareBackend.QSV:
-            cmd.extend(self._build_qsv_command())
+            video_cmd = self._build_qsv_command()
         elif self.hardware_backend == HardwareBackend.VAAPI:
-            cmd.extend(self._build_vaapi_command())
+            video_cmd = self._build_vaapi_command()
         elif self.hardware_backend == HardwareBackend.V4L2M2M:
-            cmd.extend(self._build_v4l2m2m_command())
+            video_cmd = self._build_v4l2m2m_command()
         else:
             # Software encoding
-            cmd.extend(self._build_software_command())
-        
-        # Add audio (common for all backends)
-        cmd.extend(self._build_audio_command())
-        
-        # Add output file
-        cmd.append(self.transcoding.transcoded_video.path)
-        
-        return cmd
+            video_cmd = self._build_software_command()
+        
+        return [
+            # -nostats: no periodic progress lines piling up in the captured stderr
+            self.ffmpeg_path, "-hide_banner", "-nostats", "-y",
+            *video_cmd,
+            # Audio (common for all backends)
+            *self._build_audio_command(),
+            # Output file
+            self.transcoding.transcoded_video.path,
+        ]
     
     def _build_qsv_command(self) -> List[str]:
         """Builds QSV-specific FFmpeg command arguments."""
         config = self.transcoding.configuration
-        device_path = self.hardware_backend.device_path()
-        
-        cmd_parts = []
         
-        # Initialize QSV hardware device
-        # Format: qsv=hw:/dev/dri/renderD128 (hw: specifies hardware device)
-        cmd_parts.extend(["-init_hw_device", f"qsv=hw:{device_path}"])
-        cmd_parts.extend(["-filter_hw_device", "hw"])
-        
-        # Input file (no hwaccel before input - use software decoder, QSV encoder)
-        cmd_parts.extend(["-i", self.transcoding.original_video.path])
-        
-        # Video filter: format conversion and hardware upload (matching working command format)
-        # Add vpp_qsv only if scaling or framerate change is needed
-        vf_parts = ["format=nv12", "hwupload=extra_hw_frames=64"]
-        # Add vpp_qsv for scaling/framerate if needed
-        vf_parts.append(f"vpp_qsv=framerate={int(config.video_framerate)}:h={config.video_height}:w=trunc(oh*dar/2)*2,setsar=1")
-        vf = ",".join(vf_parts)
-        cmd_parts.extend(["-vf", vf])
-        
-        # Video encoder
-        cmd_parts.extend(["-c:v", self.video_encoder])
-        
-        # Profile
-        if config.video_profile:
-            cmd_parts.extend(["-profile:v", config.video_profile.value])
-        
-        # Bitrate
-        cmd_parts.extend(["-b:v", f"{config.video_bitrate}k"])
-        cmd_parts.extend(["-maxrate", f"{config.video_bitrate}k"])
-        
-        # Common flags
-        cmd_parts.extend(["-vsync", "cfr"])
-        cmd_parts.extend(["-sar", "1"])
-        cmd_parts.extend(["-movflags", "+faststart"])
-        cmd_parts.extend(["-threads", str(self.transcoding.configuration.execution_threads)])
+        # Video filter: format conversion and hardware upload, then vpp_qsv for scaling/framerate
+        vf = (
+            "format=nv12,hwupload=extra_hw_frames=64,"
+            f"vpp_qsv=framerate={self._video_framerate}:h={config.video_height}:w=trunc(oh*dar/2)*2,setsar=1"
+        )
         
-        return cmd_parts
+        return [
+            # Initialize QSV hardware device
+            # Format: qsv=hw:/dev/dri/renderD128 (hw: specifies hardware device)
+            "-init_hw_device", f"qsv=hw:{self._device_path}",
+            "-filter_hw_device", "hw",
+            # Input file (no hwaccel before input - use software decoder, QSV encoder)
+            "-i", self.transcoding.original_video.path,
+            "-vf", vf,
+            # Constant framerate (sample aspect ratio is already set by the setsar filter)
+            "-fps_mode", "cfr",
+            *self._build_common_video_tail(),
+        ]
     
     def _build_vaapi_command(self) -> List[str]:
         """Builds VAAPI-specific FFmpeg command arguments."""
         config = self.transcoding.configuration
-        device_path = self.hardware_backend.device_path()
-        
-        cmd_parts = []
-        
-        cmd_parts.extend(["-vaapi_device", device_path])
-        
-        # Hardware acceleration
-        cmd_parts.extend(["-hwaccel", "vaapi"])
-        cmd_parts.extend(["-hwaccel_device", device_path])
-        cmd_parts.extend(["-hwaccel_output_format", "vaapi"])
-        
-        # Input file
-        cmd_parts.extend(["-i", self.transcoding.original_video.path])
-        
-        # Video filter: scale_vaapi
-        cmd_parts.extend(["-vf", f"scale_vaapi=w=-2:h={config.video_height}"])
-        
-        # Framerate
-        cmd_parts.extend(["-r", str(int(config.video_framerate))])
         
-        # Video encoder
-        cmd_parts.extend(["-c:v", self.video_encoder])
-        
-        # Profile
-        if config.video_profile:
-            cmd_parts.extend(["-profile:v", config.video_profile.value])
-        
-        # Bitrate
-        cmd_parts.extend(["-b:v", f"{config.video_bitrate}k"])
-        cmd_parts.extend(["-maxrate", f"{config.video_bitrate}k"])
-        
-        # Common flags
-        cmd_parts.extend(["-vsync", "cfr"])
-        cmd_parts.extend(["-sar", "1"])
-        cmd_parts.extend(["-movflags", "+faststart"])
-        cmd_parts.extend(["-threads", str(self.transcoding.configuration.execution_threads)])
-        
-        return cmd_parts
+        return [
+            "-vaapi_device", self._device_path,
+            # Hardware acceleration
+            "-hwaccel", "vaapi",
+            "-hwaccel_device", self._device_path,
+            "-hwaccel_output_format", "vaapi",
+            # Input file
+            "-i", self.transcoding.original_video.path,
+            # Video filter: scale_vaapi
+            "-vf", f"scale_vaapi=w=-2:h={config.video_height}",
+            # Framerate
+            "-r", self._video_framerate,
+            # Common flags
+            "-fps_mode", "cfr",
+            "-sar", "1",
+            *self._build_common_video_tail(),
+        ]
     
     def _build_v4l2m2m_command(self) -> List[str]:
         """Builds V4L2M2M-specific FFmpeg command arguments."""
         config = self.transcoding.configuration
-        
-        cmd_parts = []
-        
-        # V4L2M2M uses hardware decoder in input
-        cmd_parts.extend(["-c:v", self.video_encoder])
-        cmd_parts.extend(["-i", self.transcoding.original_video.path])
-        
-        # Video filter: software scale (no hardware scale available)
-        cmd_parts.extend(["-vf", f"scale=w=-2:h={config.video_height}"])
-        
-        # Framerate
-        cmd_parts.extend(["-r", str(int(config.video_framerate))])
-        
-        # Video encoder (output) with pixel format
-        cmd_parts.extend(["-c:v", self.video_encoder])
-        cmd_parts.extend(["-pix_fmt", "nv12"])
-        
-        # Bitrate
-        cmd_parts.extend(["-b:v", f"{config.video_bitrate}k"])
-        cmd_parts.extend(["-maxrate", f"{config.video_bitrate}k"])
-        cmd_parts.extend(["-bufsize", f"{config.video_bitrate * 2}k"])
-        
-        # Common flags
-        cmd_parts.extend(["-vsync", "cfr"])
-        cmd_parts.extend(["-sar", "1"])
-        
-        return cmd_parts
+        # Keyed by the reported codec: codec_name is h264 for unknown codecs and placeholders
+        decoder = V4L2M2M_DECODERS.get(self.transcoding.original_video.video_track.source_codec_name)
+        
+        return [
+            # Hardware decoder for the input, only when the input codec has one
+            *(["-c:v", decoder] if decoder else []),
+            "-i", self.transcoding.original_video.path,
+            # Video filter: software scale (no hardware scale available), converting to the
+            # encoder's nv12 pixel format within the same filter graph
+            "-vf", f"scale=w=-2:h={config.video_height},format=nv12",
+            # Framerate
+            "-r", self._video_framerate,
+            # Video encoder (output)
+            "-c:v", self.video_encoder,
+            # Bitrate
+            "-b:v", self._video_bitrate,
+            "-maxrate", self._video_bitrate,
+            "-bufsize", self._video_bufsize,
+            # Common flags
+            "-fps_mode", "cfr",
+            "-sar", "1",
+        ]
     
     def _build_software_command(self) -> List[str]:
         """Builds software-only FFmpeg command arguments (no hardware acceleration)."""
         config = self.transcoding.configuration
         
-        cmd_parts = []
-        
-        # Input file
-        cmd_parts.extend(["-i", self.transcoding.original_video.path])
-        
-        # Video filter: software scale
-        cmd_parts.extend(["-vf", f"scale=w=-2:h={config.video_height}"])
-        
-        # Framerate
-        cmd_parts.extend(["-r", str(int(config.video_framerate))])
-        
-        # Video encoder (software)
-        cmd_parts.extend(["-c:v", self.video_encoder])
-        
-        # Profile
-        if config.video_profile:
-            cmd_parts.extend(["-profile:v", config.video_profile.value])
-        
-        # Bitrate
-        cmd_parts.extend(["-b:v", f"{config.video_bitrate}k"])
+        return [
+            # Input file
+            "-i", self.transcoding.original_video.path,
+            # Video filter: software scale
+            "-vf", f"scale=w=-2:h={config.video_height}",
+            # Threading: encoder picks its own thread count, filter graph is bounded by configuration
+            "-threads", "0",
+            "-filter_threads", self._threads,
+            # Framerate
+            "-r", self._video_framerate,
+            # Software encoders are not capped with -maxrate
+            *self._build_common_video_tail(maxrate=False),
+        ]
+    
+    def _build_common_video_tail(self, maxrate: bool = True) -> List[str]:
+        """
+        Builds the video encoder arguments shared by the QSV, VAAPI and software commands.
         
-        # Common flags
-        cmd_parts.extend(["-movflags", "+faststart"])
+        Args:
+            maxrate: Whether to cap the bitrate with -maxrate
+            
+        Returns:
+            List of encoder, profile, bitrate and muxer FFmpeg command arguments
+        """
+        config = self.transcoding.configuration
         
-        return cmd_parts
+        return [
+            # Video encoder and profile
+            "-c:v", self.video_encoder,
+            *(["-profile:v", config.video_profile.value] if config.video_profile else []),
+            # Bitrate
+            "-b:v", self._video_bitrate,
+            *(["-maxrate", self._video_bitrate] if maxrate else []),
+            # MP4 muxer flags
+            "-movflags", self._movflags,
+        ]
     
     def _build_audio_command(self) -> List[str]:
         """
@@ -255,12 +264,9 @@ class FFmpegTranscoder(Transcoder):
             List of audio-related FFmpeg command arguments
         """
         config = self.transcoding.configuration
-        cmd_parts = []
-        
-        cmd_parts.extend(["-c:a", self.audio_encoder])
-        cmd_parts.extend(["-b:a", f"{config.audio_bitrate}k"])
-        
-        if config.audio_channels > 0:
-            cmd_parts.extend(["-ac", str(config.audio_channels)])
         
-        return cmd_parts
+        return [
+            "-c:a", self.audio_encoder,
+            "-b:a", self._audio_bitrate,
+            *(["-ac", str(config.audio_channels)] if config.audio_channels > 0 else []),
+        ]
@@ -1,9 +1,12 @@
 """FFmpeg transcoder factory implementation."""
+import shutil
+
 from domain.ports.transcoder_factory import TranscoderFactory
 from domain.ports.transcoder import Transcoder
 from domain.ports.hardware_info import HardwareInfo
 from domain.ports.logger import AppLogger
 from domain.models.transcoding import Transcoding
+from domain.constants.hardware import HardwareBackend
 from infrastructure.transcoder.ffmpeg_transcoder import FFmpegTranscoder
 
 
@@ -14,12 +17,26 @@ class FFmpegTranscoderFactory(TranscoderFactory):
         """
         Initializes the factory.
 
+        The hardware backend and the ffmpeg executable path are resolved once here and
+        shared by every transcoder created afterwards, since neither changes at runtime.
+
         Args:
             hardware_info: Hardware information for transcoding
             logger: Application logger
+
+        Raises:
+            RuntimeError: If the ffmpeg executable cannot be found in PATH
         """
         self.hardware_info = hardware_info
         self.logger = logger
+        self.hardware_backend = HardwareBackend.from_hardware_acceleration(hardware_info.video_acceleration)
+
+        ffmpeg_path = shutil.which("ffmpeg")
+        if not ffmpeg_path:
+            error_msg = "FFmpeg executable not found in PATH"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        self.ffmpeg_path = ffmpeg_path
 
     def create(self, transcoding: Transcoding) -> Transcoder:
         """
@@ -31,4 +48,10 @@ class FFmpegTranscoderFactory(TranscoderFactory):
         Returns:
             A configured FFmpegTranscoder instance
         """
-        return FFmpegTranscoder(transcoding, self.hardware_info, self.logger)
+        return FFmpegTranscoder(
+            transcoding,
+            self.hardware_info,
+            self.logger,
+            hardware_backend=self.hardware_backend,
+            ffmpeg_path=self.ffmpeg_path
+        )
@@ -1,11 +1,19 @@
 """Common utility functions for infrastructure layer."""
 
 
-from typing import Any
+import os
+from typing import Any, Optional
 
 
 def to_int(value: Any, default: int = 0) -> int:
     """Converts a value to an integer."""
+    # Fast paths for the common cases: plain ints and clean decimal strings
+    value_type = type(value)
+    if value_type is int:
+        return value
+    if value_type is str and value.isdecimal():
+        return int(value)
+
     if isinstance(value, int) and not isinstance(value, bool):
         return value
 
@@ -18,3 +26,42 @@ def to_int(value: Any, default: int = 0) -> int:
 
     return default
 
+
+def to_cpu_list(value: Any, cpu_count: Optional[int] = None) -> Optional[list[int]]:
+    """
+    Parses a CPU list such as "1-3" or "0,2,4-5" into sorted CPU indexes.
+
+    Args:
+        value: CPU list string (same format as taskset -c)
+        cpu_count: Number of CPUs of the system (defaults to os.cpu_count())
+
+    Returns:
+        Sorted list of CPU indexes, or None if value is empty, invalid or
+        references a CPU the system does not have
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    if cpu_count is None:
+        cpu_count = os.cpu_count() or 1
+
+    cpus = set()
+    try:
+        for part in value.split(","):
+            part = part.strip()
+            if "-" in part:
+                start, end = part.split("-", 1)
+                start, end = int(start), int(end)
+                # Bounds are checked before expanding, so huge ranges never build a list
+                if start < 0 or end < start or end >= cpu_count:
+                    return None
+                cpus.update(range(start, end + 1))
+            else:
+                cpu = int(part)
+                if cpu < 0 or cpu >= cpu_count:
+                    return None
+                cpus.add(cpu)
+    except ValueError:
+        return None
+
+    return sorted(cpus)
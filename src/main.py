@@ -1,8 +1,9 @@
 """Main entry point - composition root."""
+import os
 import sys
 import signal
-import time
-from pathlib import Path
+import threading
+import traceback
 import schedule
 
 from infrastructure.config.config import Config
@@ -10,7 +11,7 @@ from infrastructure.logger import Logger
 from infrastructure.db.connection import DatabaseConnection
 from infrastructure.db.video_repository_sql import VideoRepositorySQL
 from infrastructure.filesystem.local_filesystem import LocalFilesystem
-from infrastructure.hardware.local_hardware_info import LocalHardwareInfo, HW_ACCELERATION_DEVICE_PATH
+from infrastructure.hardware.local_hardware_info import LocalHardwareInfo, HW_ACCELERATION_DEVICE_PATH, has_hw_acceleration_device
 from infrastructure.transcoder.ffmpeg_transcoder_factory import FFmpegTranscoderFactory
 from application.process_videos_use_case import ProcessVideosUseCase
 from controllers.main_controller import MainController
@@ -18,16 +19,58 @@ from domain.constants.container import get_video_extensions
 from domain.models.hardware import CPUVendor
 
 
-# Global flag for graceful shutdown
-_shutdown_requested = False
+# Maximum time (in seconds) the main loop sleeps between scheduler checks
+MAX_IDLE_SECONDS = 60
+
+# Global event for graceful shutdown (set by signal handlers, wakes up any pending wait)
+_shutdown_event = threading.Event()
 
 
 def _signal_handler(signum, frame):
     """Handles shutdown signals gracefully."""
-    global _shutdown_requested
     logger = Logger.get_logger()
     logger.info(f"Received signal {signum}, shutting down gracefully...")
-    _shutdown_requested = True
+    _shutdown_event.set()
+
+
+def _next_wakeup_timeout() -> float:
+    """
+    Calculates how long the main loop can sleep until the next scheduled job.
+
+    Returns:
+        Seconds to wait, bounded between 1 and MAX_IDLE_SECONDS
+    """
+    idle_seconds = schedule.idle_seconds()
+    if idle_seconds is None:
+        return MAX_IDLE_SECONDS
+    return max(1, min(MAX_IDLE_SECONDS, idle_seconds))
+
+
+def _apply_process_priority(transcoding_config, logger):
+    """
+    Lowers the scheduling priority and restricts the CPU cores of the process.
+    
+    Applied once at startup so every FFmpeg child inherits the same limits without
+    needing a preexec_fn (which would disable the posix_spawn fast path).
+    
+    Args:
+        transcoding_config: TranscodingConfig with nice_level and cpu_affinity
+        logger: Logger instance
+    """
+    if transcoding_config.nice_level > 0:
+        try:
+            os.nice(transcoding_config.nice_level)
+        except OSError as e:
+            logger.warning(f"Could not set nice level {transcoding_config.nice_level}: {e}")
+    
+    if transcoding_config.cpu_affinity:
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("CPU affinity is not supported on this platform")
+            return
+        try:
+            os.sched_setaffinity(0, transcoding_config.cpu_affinity)
+        except OSError as e:
+            logger.warning(f"Could not set CPU affinity {transcoding_config.cpu_affinity}: {e}")
 
 
 def _run_processing(controller, logger, execution_interval=None):
@@ -60,14 +103,11 @@ def _run_processing(controller, logger, execution_interval=None):
         
     except Exception as e:
         logger.error(f"Error during video processing: {e}")
-        import traceback
         logger.error(traceback.format_exc())
 
 
 def main():
     """Main application entry point - composition root."""
-    global _shutdown_requested
-    
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGTERM, _signal_handler)
     signal.signal(signal.SIGINT, _signal_handler)
@@ -79,6 +119,7 @@ def main():
         # 1. Load configuration
         config = Config.load()
         config.log_config(logger)
+        _apply_process_priority(config.transcoding, logger)
         
         # 2. Initialize infrastructure adapters (once, reused across all executions)
         logger.info("Initializing infrastructure adapters...")
@@ -91,7 +132,9 @@ def main():
         video_repository = VideoRepositorySQL(db_connection)
         
         # Filesystem
-        filesystem = LocalFilesystem(get_video_extensions())
+        # Directory listings are cached next to the database so unchanged folders are not re-read
+        scan_cache_path = os.path.join(os.path.dirname(config.database.path), "scan_cache.json")
+        filesystem = LocalFilesystem(get_video_extensions(), cache_path=scan_cache_path)
         
         # Hardware info
         hardware_info = LocalHardwareInfo()
@@ -99,7 +142,7 @@ def main():
         cpu = hardware_info.cpu
         video_accel = hardware_info.video_acceleration
         if cpu.vendor in (CPUVendor.INTEL, CPUVendor.AMD):
-            if not Path(HW_ACCELERATION_DEVICE_PATH).exists():
+            if not has_hw_acceleration_device():
                 logger.warning(f"DRI device not found ({HW_ACCELERATION_DEVICE_PATH})")
         logger.info("Hardware detected successfully")
         logger.info(f"  - CPU: {cpu}")
@@ -118,7 +161,8 @@ def main():
             video_config=config.transcoding.video,
             audio_config=config.transcoding.audio,
             video_input_path=config.paths.media_path,
-            execution_threads=config.transcoding.execution_threads
+            execution_threads=config.transcoding.execution_threads,
+            fragmented_mp4=config.transcoding.fragmented_mp4
         )
         
         # 4. Build controller (reused across all executions)
@@ -133,15 +177,10 @@ def main():
         
         # Wait for startup delay: allows container/system to fully initialize before processing videos.
         # This prevents immediate processing on container startup and ensures all services are ready.
-        # The delay is checked second-by-second to allow graceful shutdown if requested during this period.
-        startup_delay_seconds = startup_delay * 60
-        elapsed = 0
-        while elapsed < startup_delay_seconds and not _shutdown_requested:
-
-            time.sleep(1)
-            elapsed += 1
+        # The wait returns early if a shutdown is requested during this period.
+        _shutdown_event.wait(timeout=startup_delay * 60)
         
-        if _shutdown_requested:
+        if _shutdown_event.is_set():
             logger.info("Shutdown requested during startup delay")
             return
         
@@ -158,12 +197,12 @@ def main():
         _run_processing(controller, logger, execution_interval=execution_interval)
 
         # Main loop: run scheduled tasks
-        # This loop checks for pending scheduled tasks every second while allowing immediate
-        # graceful shutdown via signal handlers. The 1-second sleep prevents CPU spinning while
-        # maintaining responsiveness to shutdown signals.
-        while not _shutdown_requested:
+        # Sleeps until the next scheduled job is due (capped at MAX_IDLE_SECONDS) instead of
+        # polling every second. Signal handlers set the shutdown event, which wakes the wait
+        # immediately for a graceful shutdown.
+        while not _shutdown_event.is_set():
             schedule.run_pending()
-            time.sleep(1)
+            _shutdown_event.wait(timeout=_next_wakeup_timeout())
         
         logger.info("Shutdown complete")
         
@@ -171,7 +210,6 @@ def main():
         logger.info("Interrupted by user")
     except Exception as e:
         logger.error(f"Application error: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         sys.exit(1)
 
@@ -1,7 +1,6 @@
 """Pytest configuration and shared fixtures."""
 import pytest
 import os
-import tempfile
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
 
@@ -15,10 +14,9 @@ if str(Path(__file__).parent.parent / "src") not in sys.path:
 
 
 @pytest.fixture
-def temp_dir():
-    """Creates a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+def temp_dir(tmp_path):
+    """Creates a temporary directory for tests (unique per test, safe under pytest-xdist)."""
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -27,6 +25,48 @@ def temp_db_path(temp_dir):
     return os.path.join(temp_dir, "test.db")
 
 
+# Files of the read-only sample media tree (relative to its root)
+SAMPLE_TREE_FILES = (
+    "video1.mp4",
+    "video2.AVI",
+    "document.txt",
+    ".hidden.mp4",
+    "album/nested/video3.mkv",
+    "album/nested/@eaDir/video3.mkv/SYNOPHOTO_FILM_M.mp4",
+    "@eaDir/video1.mp4/SYNOPHOTO_FILM_H.mp4",
+    "#recycle/old.mp4",
+)
+
+
+@pytest.fixture(scope="session")
+def sample_tree(tmp_path_factory):
+    """Creates a read-only sample media tree on disk once per session. Tests must not modify it."""
+    root = str(tmp_path_factory.mktemp("media"))
+    for relative_path in SAMPLE_TREE_FILES:
+        path = os.path.join(root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o644))
+    return root
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Creates an in-memory SQLite engine with the schema, shared across the session."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+    from infrastructure.db.connection import Base
+    import infrastructure.db.models  # noqa: F401 - registers the tables in Base.metadata
+    
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
 @pytest.fixture
 def mock_video_repository():
     """Creates a mock VideoRepository."""
@@ -89,9 +129,9 @@ def mock_transcoder_factory(mock_transcoder):
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_video():
-    """Creates a sample Video object for testing."""
+    """Creates a sample Video object for testing (shared across the session, Video is frozen)."""
     from domain.models.video import Video, VideoTrack, AudioTrack, Container
     
     return Video(
@@ -117,9 +157,13 @@ def sample_video():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcoding_configuration():
-    """Creates a sample TranscodingConfiguration for testing."""
+    """
+    Creates a sample TranscodingConfiguration for testing.
+    
+    Shared across the session: tests must not mutate it (use model_copy(update=...) instead).
+    """
     from domain.models.transcoding import TranscodingConfiguration
     from domain.constants.video import VideoCodec, VideoProfile
     from domain.constants.audio import AudioCodec
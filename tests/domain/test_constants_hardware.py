@@ -7,48 +7,27 @@ from domain.models.hardware import HardwareVideoAcceleration
 class TestHardwareBackend:
     """Tests for HardwareBackend enum."""
     
-    def test_device_path_qsv(self):
-        """Test device_path for QSV backend."""
-        assert HardwareBackend.QSV.device_path() == "/dev/dri/renderD128"
-    
-    def test_device_path_vaapi(self):
-        """Test device_path for VAAPI backend."""
-        assert HardwareBackend.VAAPI.device_path() == "/dev/dri/renderD128"
-    
-    def test_device_path_v4l2m2m(self):
-        """Test device_path for V4L2M2M backend."""
-        assert HardwareBackend.V4L2M2M.device_path() == "/dev/video10"
-    
-    def test_device_path_none(self):
-        """Test device_path for NONE backend."""
-        assert HardwareBackend.NONE.device_path() is None
-    
-    def test_from_hardware_acceleration_qsv(self):
-        """Test from_hardware_acceleration with QSV."""
-        backend = HardwareBackend.from_hardware_acceleration(HardwareVideoAcceleration.QSV)
-        assert backend == HardwareBackend.QSV
-    
-    def test_from_hardware_acceleration_vaapi(self):
-        """Test from_hardware_acceleration with VAAPI."""
-        backend = HardwareBackend.from_hardware_acceleration(HardwareVideoAcceleration.VAAPI)
-        assert backend == HardwareBackend.VAAPI
-    
-    def test_from_hardware_acceleration_v4l2m2m(self):
-        """Test from_hardware_acceleration with V4L2M2M."""
-        backend = HardwareBackend.from_hardware_acceleration(HardwareVideoAcceleration.V4L2M2M)
-        assert backend == HardwareBackend.V4L2M2M
-    
-    def test_from_hardware_acceleration_none(self):
-        """Test from_hardware_acceleration with None."""
-        backend = HardwareBackend.from_hardware_acceleration(None)
-        assert backend == HardwareBackend.NONE
-    
-    def test_from_hardware_acceleration_unknown(self):
-        """Test from_hardware_acceleration with unknown value defaults to NONE."""
-        # This would require a mock or an invalid enum value
-        # For now, we test that None returns NONE
-        backend = HardwareBackend.from_hardware_acceleration(None)
-        assert backend == HardwareBackend.NONE
+    @pytest.mark.parametrize("backend,expected_path", [
+        (HardwareBackend.QSV, "/dev/dri/renderD128"),
+        (HardwareBackend.VAAPI, "/dev/dri/renderD128"),
+        (HardwareBackend.V4L2M2M, "/dev/video10"),
+        (HardwareBackend.NONE, None),
+    ])
+    def test_device_path(self, backend, expected_path):
+        """Test device_path for each backend."""
+        assert backend.device_path() == expected_path
+    
+    @pytest.mark.parametrize("acceleration,expected_backend", [
+        (HardwareVideoAcceleration.QSV, HardwareBackend.QSV),
+        (HardwareVideoAcceleration.VAAPI, HardwareBackend.VAAPI),
+        (HardwareVideoAcceleration.V4L2M2M, HardwareBackend.V4L2M2M),
+        (None, HardwareBackend.NONE),
+        ("unknown", HardwareBackend.NONE),
+        ("none", HardwareBackend.NONE),
+    ])
+    def test_from_hardware_acceleration(self, acceleration, expected_backend):
+        """Test from_hardware_acceleration maps accelerations and defaults to NONE."""
+        assert HardwareBackend.from_hardware_acceleration(acceleration) == expected_backend
 
 
 class TestCPUVendor:
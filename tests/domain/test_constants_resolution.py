@@ -26,27 +26,20 @@ class TestVideoResolution:
         """Test that from_str strips whitespace."""
         assert VideoResolution.from_str("  720p  ") == VideoResolution.P720
     
-    def test_width_property(self):
-        """Test width property for all resolutions."""
-        assert VideoResolution.P144.width == 256
-        assert VideoResolution.P240.width == 426
-        assert VideoResolution.P360.width == 640
-        assert VideoResolution.P480.width == 854
-        assert VideoResolution.P720.width == 1280
-        assert VideoResolution.P1080.width == 1920
-        assert VideoResolution.P1440.width == 2560
-        assert VideoResolution.P2160.width == 3840
-    
-    def test_height_property(self):
-        """Test height property for all resolutions."""
-        assert VideoResolution.P144.height == 144
-        assert VideoResolution.P240.height == 240
-        assert VideoResolution.P360.height == 360
-        assert VideoResolution.P480.height == 480
-        assert VideoResolution.P720.height == 720
-        assert VideoResolution.P1080.height == 1080
-        assert VideoResolution.P1440.height == 1440
-        assert VideoResolution.P2160.height == 2160
+    @pytest.mark.parametrize("resolution,width,height", [
+        (VideoResolution.P144, 256, 144),
+        (VideoResolution.P240, 426, 240),
+        (VideoResolution.P360, 640, 360),
+        (VideoResolution.P480, 854, 480),
+        (VideoResolution.P720, 1280, 720),
+        (VideoResolution.P1080, 1920, 1080),
+        (VideoResolution.P1440, 2560, 1440),
+        (VideoResolution.P2160, 3840, 2160),
+    ])
+    def test_dimensions(self, resolution, width, height):
+        """Test width and height for all resolutions."""
+        assert resolution.width == width
+        assert resolution.height == height
     
     def test_name_property(self):
         """Test name property returns the value."""
@@ -37,10 +37,10 @@ class TestVideoCodec:
         assert VideoProfile.MAIN10 in profiles
     
     def test_supported_profiles_no_profiles(self):
-        """Test that codecs without profiles return empty list."""
-        assert VideoCodec.VP8.supported_profiles() == []
-        assert VideoCodec.VP9.supported_profiles() == []
-        assert VideoCodec.AV1.supported_profiles() == []
+        """Test that codecs without profiles return an empty set."""
+        assert VideoCodec.VP8.supported_profiles() == frozenset()
+        assert VideoCodec.VP9.supported_profiles() == frozenset()
+        assert VideoCodec.AV1.supported_profiles() == frozenset()
     
     def test_supports_profile(self):
         """Test supports_profile method."""
@@ -138,30 +138,33 @@ class TestHWVideoEncoder:
         encoder = HWVideoEncoder.get_encoder(VideoCodec.VP8, HardwareBackend.VAAPI)
         assert encoder is None
     
-    def test_encoder_all_codecs_software(self):
-        """Test encoder method for all codecs without hardware."""
-        assert VideoCodec.MPEG4.encoder() == SWVideoEncoder.MPEG4.value
-        assert VideoCodec.MPEG2VIDEO.encoder() == SWVideoEncoder.MPEG2VIDEO.value
-        assert VideoCodec.VP8.encoder() == SWVideoEncoder.VP8.value
-        assert VideoCodec.VP9.encoder() == SWVideoEncoder.VP9.value
-        assert VideoCodec.AV1.encoder() == SWVideoEncoder.AV1.value
-    
-    def test_encoder_hardware_all_backends_h264(self):
-        """Test H264 encoder with all hardware backends."""
-        assert VideoCodec.H264.encoder(HardwareBackend.QSV) == HWVideoEncoder.H264_QSV.value
-        assert VideoCodec.H264.encoder(HardwareBackend.VAAPI) == HWVideoEncoder.H264_VAAPI.value
-        assert VideoCodec.H264.encoder(HardwareBackend.V4L2M2M) == HWVideoEncoder.H264_V4L2M2M.value
-    
-    def test_encoder_hardware_all_backends_hevc(self):
-        """Test HEVC encoder with all hardware backends."""
-        assert VideoCodec.HEVC.encoder(HardwareBackend.QSV) == HWVideoEncoder.HEVC_QSV.value
-        assert VideoCodec.HEVC.encoder(HardwareBackend.VAAPI) == HWVideoEncoder.HEVC_VAAPI.value
-        assert VideoCodec.HEVC.encoder(HardwareBackend.V4L2M2M) == HWVideoEncoder.HEVC_V4L2M2M.value
-    
-    def test_encoder_hardware_mpeg2video(self):
-        """Test MPEG2VIDEO encoder with hardware backends."""
-        assert VideoCodec.MPEG2VIDEO.encoder(HardwareBackend.QSV) == HWVideoEncoder.MPEG2VIDEO_QSV.value
-        assert VideoCodec.MPEG2VIDEO.encoder(HardwareBackend.VAAPI) == HWVideoEncoder.MPEG2VIDEO_VAAPI.value
+    @pytest.mark.parametrize("codec,backend,expected", [
+        # Software encoders (no hardware backend)
+        (VideoCodec.H264, None, SWVideoEncoder.H264.value),
+        (VideoCodec.HEVC, None, SWVideoEncoder.HEVC.value),
+        (VideoCodec.MPEG4, None, SWVideoEncoder.MPEG4.value),
+        (VideoCodec.MPEG2VIDEO, None, SWVideoEncoder.MPEG2VIDEO.value),
+        (VideoCodec.VP8, None, SWVideoEncoder.VP8.value),
+        (VideoCodec.VP9, None, SWVideoEncoder.VP9.value),
+        (VideoCodec.AV1, None, SWVideoEncoder.AV1.value),
+        # Hardware encoders
+        (VideoCodec.H264, HardwareBackend.QSV, HWVideoEncoder.H264_QSV.value),
+        (VideoCodec.H264, HardwareBackend.VAAPI, HWVideoEncoder.H264_VAAPI.value),
+        (VideoCodec.H264, HardwareBackend.V4L2M2M, HWVideoEncoder.H264_V4L2M2M.value),
+        (VideoCodec.HEVC, HardwareBackend.QSV, HWVideoEncoder.HEVC_QSV.value),
+        (VideoCodec.HEVC, HardwareBackend.VAAPI, HWVideoEncoder.HEVC_VAAPI.value),
+        (VideoCodec.HEVC, HardwareBackend.V4L2M2M, HWVideoEncoder.HEVC_V4L2M2M.value),
+        (VideoCodec.MPEG2VIDEO, HardwareBackend.QSV, HWVideoEncoder.MPEG2VIDEO_QSV.value),
+        (VideoCodec.MPEG2VIDEO, HardwareBackend.VAAPI, HWVideoEncoder.MPEG2VIDEO_VAAPI.value),
+        (VideoCodec.MPEG2VIDEO, HardwareBackend.V4L2M2M, HWVideoEncoder.MPEG2VIDEO_V4L2M2M.value),
+        # Software fallback (NONE backend or codec without hardware encoder)
+        (VideoCodec.H264, HardwareBackend.NONE, SWVideoEncoder.H264.value),
+        (VideoCodec.VP8, HardwareBackend.VAAPI, SWVideoEncoder.VP8.value),
+        (VideoCodec.AV1, HardwareBackend.QSV, SWVideoEncoder.AV1.value),
+    ])
+    def test_encoder_matrix(self, codec, backend, expected):
+        """Test encoder method for every codec and backend combination."""
+        assert codec.encoder(backend) == expected
     
     def test_supported_profiles_mpeg2video(self):
         """Test that MPEG2VIDEO returns correct supported profiles."""
@@ -132,6 +132,17 @@ class TestTranscodingConfig:
         
         assert config.execution_threads == 2
         # Note: startup_delay and execution_interval are in TranscodingConfig, not TranscodingConfiguration
+    
+    def test_nice_level_validation_clamps_to_range(self):
+        """Test that nice level is clamped to valid range [0, 19]."""
+        video = VideoConfig(codec=VideoCodec.H264, bitrate=2048, resolution=VideoResolution.P720, width=1280, height=720)
+        audio = AudioConfig(codec=AudioCodec.AAC, bitrate=128, channels=2)
+        common = dict(hw_transcoding=True, execution_threads=2, startup_delay=30,
+                      execution_interval=240, video=video, audio=audio)
+        
+        assert TranscodingConfig(**common).nice_level == 10  # Default
+        assert TranscodingConfig(**common, nice_level=-5).nice_level == 0  # Clamped to minimum
+        assert TranscodingConfig(**common, nice_level=25).nice_level == 19  # Clamped to maximum
 
 
 class TestPathsConfig:
@@ -1,6 +1,7 @@
 """Tests for transcoding domain models."""
 import pytest
 from datetime import datetime
+from pydantic import ValidationError
 from domain.models.transcoding import (
     Transcoding,
     TranscodingConfiguration,
@@ -23,7 +24,7 @@ class TestTranscodingConfiguration:
     
     def test_configuration_required_fields(self):
         """Test that required fields are enforced."""
-        with pytest.raises(Exception):  # Pydantic validation error
+        with pytest.raises(ValidationError):
             TranscodingConfiguration(
                 video_codec=VideoCodec.H264,
                 # Missing required fields
@@ -4,6 +4,33 @@ from domain.models.video import Video, VideoTrack, AudioTrack, Container
 from domain.constants.synology import MetadataIndex
 
 
+def _build_complete_metadata():
+    """Builds a Synology metadata list with every field read by Video.from_synology_metadata."""
+    metadata = [None] * 60
+    metadata[MetadataIndex.WIDTH] = "1920"
+    metadata[MetadataIndex.HEIGHT] = "1080"
+    metadata[MetadataIndex.VIDEO_CODEC] = "h264"
+    metadata[MetadataIndex.FRAMERATE] = "30"
+    metadata[MetadataIndex.VIDEO_BITRATE] = "5000.0"
+    metadata[MetadataIndex.AUDIO_BITRATE] = "128.0"
+    metadata[MetadataIndex.AUDIO_CODEC] = "aac"
+    metadata[MetadataIndex.CHANNELS] = "2"
+    metadata[MetadataIndex.CONTAINER] = "mp4"
+    metadata[MetadataIndex.DURATION] = "120.0"
+    metadata[MetadataIndex.TOTAL_BITRATE] = "5128.0"
+    metadata[MetadataIndex.FILE_SIZE] = "76920000"
+    return metadata
+
+
+_COMPLETE_METADATA = tuple(_build_complete_metadata())
+
+
+@pytest.fixture
+def complete_metadata():
+    """Returns a fresh copy of the complete Synology metadata template."""
+    return list(_COMPLETE_METADATA)
+
+
 class TestVideoTrack:
     """Tests for VideoTrack model."""
     
@@ -24,18 +51,29 @@ class TestVideoTrack:
     
     def test_resolution_property(self):
         """Test resolution property."""
-        track = VideoTrack(width=1920, height=1080, codec_name="h264", framerate=30)
+        # Validation is not under test here, so skip it
+        track = VideoTrack.model_construct(width=1920, height=1080, codec_name="h264", framerate=30)
         assert track.resolution == "1920x1080"
     
-    def test_codec_validation_defaults_to_h264(self):
-        """Test that invalid codec defaults to h264."""
-        track = VideoTrack(width=1920, height=1080, codec_name="invalid", framerate=30)
-        assert track.codec_name == "h264"
+    @pytest.mark.parametrize("codec_name,expected", [
+        ("invalid", "h264"),
+        ("", "h264"),
+        ("HEVC", "hevc"),
+    ], ids=["invalid", "empty", "case-insensitive"])
+    def test_codec_validation(self, codec_name, expected):
+        """Test that codec is normalized and defaults to h264 when invalid or empty."""
+        track = VideoTrack(width=1920, height=1080, codec_name=codec_name, framerate=30)
+        assert track.codec_name == expected
     
-    def test_codec_validation_empty_defaults_to_h264(self):
-        """Test that empty codec defaults to h264."""
-        track = VideoTrack(width=1920, height=1080, codec_name="", framerate=30)
-        assert track.codec_name == "h264"
+    @pytest.mark.parametrize("codec_name,expected", [
+        ("mjpeg", "mjpeg"),
+        ("", ""),
+        (" HEVC ", "hevc"),
+    ])
+    def test_source_codec_name(self, codec_name, expected):
+        """Test the reported codec is kept even when codec_name falls back to h264."""
+        track = VideoTrack(width=1920, height=1080, codec_name=codec_name, framerate=30)
+        assert track.source_codec_name == expected
 
 
 class TestAudioTrack:
@@ -49,15 +87,15 @@ class TestAudioTrack:
         assert track.codec == "aac"
         assert track.channels == 2
     
-    def test_codec_validation_defaults_to_mp3(self):
-        """Test that invalid codec defaults to mp3."""
-        track = AudioTrack(codec="invalid")
-        assert track.codec == "mp3"
-    
-    def test_codec_validation_empty_defaults_to_mp3(self):
-        """Test that empty codec defaults to mp3."""
-        track = AudioTrack(codec="")
-        assert track.codec == "mp3"
+    @pytest.mark.parametrize("codec,expected", [
+        ("invalid", "mp3"),
+        ("", "mp3"),
+        ("AAC", "aac"),
+    ], ids=["invalid", "empty", "case-insensitive"])
+    def test_codec_validation(self, codec, expected):
+        """Test that codec is normalized and defaults to mp3 when invalid or empty."""
+        track = AudioTrack(codec=codec)
+        assert track.codec == expected
 
 
 class TestContainer:
@@ -72,15 +110,15 @@ class TestContainer:
         assert container.total_bitrate == 5000.0
         assert container.file_size == 75000000
     
-    def test_format_validation_defaults_to_mp4(self):
-        """Test that invalid format defaults to mp4."""
-        container = Container(format="invalid")
-        assert container.format == "mp4"
-    
-    def test_format_validation_empty_defaults_to_mp4(self):
-        """Test that empty format defaults to mp4."""
-        container = Container(format="")
-        assert container.format == "mp4"
+    @pytest.mark.parametrize("container_format,expected", [
+        ("invalid", "mp4"),
+        ("", "mp4"),
+        ("MP4", "mp4"),
+    ], ids=["invalid", "empty", "case-insensitive"])
+    def test_format_validation(self, container_format, expected):
+        """Test that format is normalized and defaults to mp4 when invalid or empty."""
+        container = Container(format=container_format)
+        assert container.format == expected
 
 
 class TestVideo:
@@ -99,26 +137,9 @@ class TestVideo:
         assert video.video_track.width == 1920
         assert video.container.format == "mp4"
     
-    def test_from_synology_metadata_complete(self):
+    def test_from_synology_metadata_complete(self, complete_metadata):
         """Test creating Video from complete Synology metadata."""
-        from domain.constants.synology import MetadataIndex
-        
-        # Create metadata list with correct indices according to MetadataIndex
-        metadata = [None] * 60  # Create list with enough space
-        metadata[MetadataIndex.WIDTH] = "1920"
-        metadata[MetadataIndex.HEIGHT] = "1080"
-        metadata[MetadataIndex.VIDEO_CODEC] = "h264"
-        metadata[MetadataIndex.FRAMERATE] = "30"
-        metadata[MetadataIndex.VIDEO_BITRATE] = "5000.0"
-        metadata[MetadataIndex.AUDIO_BITRATE] = "128.0"
-        metadata[MetadataIndex.AUDIO_CODEC] = "aac"
-        metadata[MetadataIndex.CHANNELS] = "2"
-        metadata[MetadataIndex.CONTAINER] = "mp4"
-        metadata[MetadataIndex.DURATION] = "120.0"
-        metadata[MetadataIndex.TOTAL_BITRATE] = "5128.0"
-        metadata[MetadataIndex.FILE_SIZE] = "76920000"
-        
-        video = Video.from_synology_metadata("/test/video.mp4", metadata)
+        video = Video.from_synology_metadata("/test/video.mp4", complete_metadata)
         
         assert video.path == "/test/video.mp4"
         assert video.video_track.width == 1920
@@ -127,12 +148,24 @@ class TestVideo:
         assert video.audio_track.codec == "aac"
         assert video.container.format == "mp4"
     
+    def test_from_synology_metadata_numeric_values(self, complete_metadata):
+        """Test creating Video from metadata whose values are already numeric."""
+        complete_metadata[MetadataIndex.WIDTH] = 1920
+        complete_metadata[MetadataIndex.HEIGHT] = 1080
+        complete_metadata[MetadataIndex.FRAMERATE] = 30
+        complete_metadata[MetadataIndex.DURATION] = 120.0
+        
+        video = Video.from_synology_metadata("/test/video.mp4", complete_metadata)
+        
+        assert video.video_track.width == 1920
+        assert video.video_track.height == 1080
+        assert video.video_track.framerate == 30
+        assert video.container.duration == 120.0
+    
     def test_from_synology_metadata_incomplete(self):
         """Test creating Video from incomplete Synology metadata uses defaults."""
-        from domain.constants.synology import MetadataIndex
-        
         # Create metadata list with only width
-        metadata = [None] * 60
+        metadata = [None] * len(_COMPLETE_METADATA)
         metadata[MetadataIndex.WIDTH] = "1920"
         # Other fields missing
         
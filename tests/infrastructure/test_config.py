@@ -1,43 +1,82 @@
 """Tests for configuration loader."""
+import copy
 import pytest
 import os
-from unittest.mock import patch
 from infrastructure.config.config import Config
 
 
+# Environment variables read by Config (removed before each test so the host environment never leaks in)
+CONFIG_ENV_VARS = (
+    "MEDIA_APP_PATH", "DATABASE_APP_PATH",
+    "HW_TRANSCODING", "EXECUTION_THREADS", "STARTUP_DELAY", "EXECUTION_INTERVAL",
+    "NICE_LEVEL", "CPU_AFFINITY", "FRAGMENTED_MP4",
+    "VIDEO_CODEC", "VIDEO_BITRATE", "VIDEO_RESOLUTION", "VIDEO_W", "VIDEO_H", "VIDEO_PROFILE",
+    "AUDIO_CODEC", "AUDIO_BITRATE", "AUDIO_CHANNELS", "AUDIO_PROFILE",
+    "LOGGER_NAME", "LOGGER_LEVEL",
+)
+
+
+def _set_env(monkeypatch, env_vars):
+    """Sets environment variables for the current test (restored by monkeypatch)."""
+    for key, value in env_vars.items():
+        monkeypatch.setenv(key, value)
+
+
 @pytest.fixture(autouse=True)
-def reset_config_singleton():
-    """Reset Config singleton before each test."""
-    # Reset singleton state
-    Config._instance = None
-    Config._app_config = None
-    yield
-    # Cleanup after test
-    Config._instance = None
-    Config._app_config = None
+def reset_config_singleton(monkeypatch):
+    """Reset Config singleton and config environment variables before each test."""
+    for key in CONFIG_ENV_VARS:
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setattr(Config, "_instance", None)
+    monkeypatch.setattr(Config, "_app_config", None)
+
+
+@pytest.fixture(scope="session")
+def _default_app_config():
+    """Loads the transcoding configuration once per session with no config variables set."""
+    with pytest.MonkeyPatch.context() as mp:
+        for key in CONFIG_ENV_VARS:
+            mp.delenv(key, raising=False)
+        Config._instance = None
+        Config._app_config = None
+        _ = Config.load().transcoding
+        app_config = Config._instance._app_config
+        Config._instance = None
+        Config._app_config = None
+    return app_config
+
+
+@pytest.fixture
+def default_app_config(_default_app_config):
+    """Returns an isolated copy of the default AppConfig."""
+    return copy.deepcopy(_default_app_config)
 
 
 class TestConfig:
     """Tests for Config class."""
     
-    def test_load_transcoding_config_defaults(self):
+    def test_load_transcoding_config_defaults(self, default_app_config):
         """Test loading transcoding config with defaults."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config.load()
-            transcoding = config.transcoding
-            
-            assert transcoding.hw_transcoding is True  # Default
-            assert transcoding.execution_threads == 2  # Default
-            assert transcoding.startup_delay == 30  # Default
-            assert transcoding.execution_interval == 240  # Default
+        transcoding = default_app_config.transcoding
+        
+        assert transcoding.hw_transcoding is True  # Default
+        assert transcoding.execution_threads == 2  # Default
+        assert transcoding.startup_delay == 30  # Default
+        assert transcoding.execution_interval == 240  # Default
+        assert transcoding.nice_level == 10  # Default
+        assert transcoding.fragmented_mp4 is False  # Default
+        assert transcoding.cpu_affinity is None  # Default
     
-    def test_load_transcoding_config_from_env(self):
+    def test_load_transcoding_config_from_env(self, monkeypatch):
         """Test loading transcoding config from environment variables."""
         env_vars = {
             "HW_TRANSCODING": "False",
             "EXECUTION_THREADS": "4",
             "STARTUP_DELAY": "60",
             "EXECUTION_INTERVAL": "120",
+            "NICE_LEVEL": "5",
+            "FRAGMENTED_MP4": "True",
+            "CPU_AFFINITY": "1-3",
             "VIDEO_CODEC": "hevc",
             "VIDEO_BITRATE": "4096",
             "VIDEO_RESOLUTION": "1080p",
@@ -46,20 +85,24 @@ class TestConfig:
             "AUDIO_CHANNELS": "5.1"
         }
         
-        with patch.dict(os.environ, env_vars, clear=False):
-            config = Config.load()
-            transcoding = config.transcoding
-            
-            assert transcoding.hw_transcoding is False
-            assert transcoding.execution_threads == 4
-            assert transcoding.startup_delay == 60
-            assert transcoding.execution_interval == 120
-            assert transcoding.video.codec.value == "hevc"
-            assert transcoding.video.bitrate == 4096
-            assert transcoding.audio.codec.value == "opus"
-            assert transcoding.audio.bitrate == 256
+        _set_env(monkeypatch, env_vars)
+        monkeypatch.setattr("infrastructure.utils.os.cpu_count", lambda: 4)
+        config = Config.load()
+        transcoding = config.transcoding
+        
+        assert transcoding.hw_transcoding is False
+        assert transcoding.execution_threads == 4
+        assert transcoding.startup_delay == 60
+        assert transcoding.execution_interval == 120
+        assert transcoding.nice_level == 5
+        assert transcoding.fragmented_mp4 is True
+        assert transcoding.cpu_affinity == [1, 2, 3]
+        assert transcoding.video.codec.value == "hevc"
+        assert transcoding.video.bitrate == 4096
+        assert transcoding.audio.codec.value == "opus"
+        assert transcoding.audio.bitrate == 256
     
-    def test_load_paths_config(self, temp_dir):
+    def test_load_paths_config(self, temp_dir, monkeypatch):
         """Test loading paths configuration."""
         media_path = os.path.join(temp_dir, "media")
         db_path = os.path.join(temp_dir, "test.db")
@@ -69,12 +112,12 @@ class TestConfig:
             "DATABASE_APP_PATH": db_path
         }
         
-        with patch.dict(os.environ, env_vars, clear=False):
-            config = Config.load()
-            paths = config.paths
-            
-            assert paths.media_path == media_path
-            assert paths.database_path == db_path
+        _set_env(monkeypatch, env_vars)
+        config = Config.load()
+        paths = config.paths
+        
+        assert paths.media_path == media_path
+        assert paths.database_path == db_path
     
     def test_singleton_pattern(self):
         """Test that Config follows singleton pattern."""
@@ -86,32 +129,31 @@ class TestConfig:
     
     def test_lazy_loading(self):
         """Test that configuration sections are loaded lazily."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config()
-            
-            # Accessing paths should trigger loading
-            _ = config.paths
-            assert config._app_config.paths is not None
-            
-            # Accessing transcoding should trigger loading
-            _ = config.transcoding
-            assert config._app_config.transcoding is not None
+        config = Config()
+        
+        # Accessing paths should trigger loading
+        _ = config.paths
+        assert config._app_config.paths is not None
+        
+        # Accessing transcoding should trigger loading
+        _ = config.transcoding
+        assert config._app_config.transcoding is not None
     
-    def test_load_video_config_with_resolution(self):
+    def test_load_video_config_with_resolution(self, monkeypatch):
         """Test loading video config with VIDEO_RESOLUTION."""
         env_vars = {
             "VIDEO_RESOLUTION": "1080p",
             "VIDEO_BITRATE": "4096"
         }
         
-        with patch.dict(os.environ, env_vars, clear=False):
-            config = Config.load()
-            
-            assert config.transcoding.video.resolution.value == "1080p"
-            assert config.transcoding.video.width == 1920
-            assert config.transcoding.video.height == 1080
+        _set_env(monkeypatch, env_vars)
+        config = Config.load()
+        
+        assert config.transcoding.video.resolution.value == "1080p"
+        assert config.transcoding.video.width == 1920
+        assert config.transcoding.video.height == 1080
     
-    def test_load_video_config_with_w_h_fallback(self):
+    def test_load_video_config_with_w_h_fallback(self, monkeypatch):
         """Test loading video config with VIDEO_W and VIDEO_H fallback."""
         from domain.constants.resolution import VideoResolution
         
@@ -122,45 +164,42 @@ class TestConfig:
             "VIDEO_CODEC": "h264"
         }
         
-        with patch.dict(os.environ, env_vars, clear=False):
-            # Reset singleton to get fresh config
-            Config._instance = None
-            Config._app_config = None
-            config = Config.load()
-            
-            # Should match P480 resolution
-            assert config.transcoding.video.resolution == VideoResolution.P480
-            # After model validation, dimensions should match resolution
-            assert config.transcoding.video.width == VideoResolution.P480.width
-            assert config.transcoding.video.height == VideoResolution.P480.height
+        _set_env(monkeypatch, env_vars)
+        config = Config.load()
+        
+        # Should match P480 resolution
+        assert config.transcoding.video.resolution == VideoResolution.P480
+        # After model validation, dimensions should match resolution
+        assert config.transcoding.video.width == VideoResolution.P480.width
+        assert config.transcoding.video.height == VideoResolution.P480.height
     
-    def test_load_video_profile(self):
+    def test_load_video_profile(self, monkeypatch):
         """Test loading video profile."""
         env_vars = {
             "VIDEO_CODEC": "h264",
             "VIDEO_PROFILE": "main"
         }
         
-        with patch.dict(os.environ, env_vars, clear=False):
-            config = Config.load()
-            
-            assert config.transcoding.video.profile is not None
-            assert config.transcoding.video.profile.value == "main"
+        _set_env(monkeypatch, env_vars)
+        config = Config.load()
+        
+        assert config.transcoding.video.profile is not None
+        assert config.transcoding.video.profile.value == "main"
     
-    def test_load_audio_profile_aac(self):
+    def test_load_audio_profile_aac(self, monkeypatch):
         """Test loading audio profile for AAC."""
         env_vars = {
             "AUDIO_CODEC": "aac",
             "AUDIO_PROFILE": "aac_he"  # Use full profile name
         }
         
-        with patch.dict(os.environ, env_vars, clear=False):
-            config = Config.load()
-            
-            assert config.transcoding.audio.profile is not None
-            assert config.transcoding.audio.profile.value == "aac_he"
+        _set_env(monkeypatch, env_vars)
+        config = Config.load()
+        
+        assert config.transcoding.audio.profile is not None
+        assert config.transcoding.audio.profile.value == "aac_he"
     
-    def test_load_database_config(self, temp_dir):
+    def test_load_database_config(self, temp_dir, monkeypatch):
         """Test loading database configuration."""
         db_path = os.path.join(temp_dir, "test.db")
         
@@ -169,28 +208,23 @@ class TestConfig:
             "MEDIA_APP_PATH": "/test/media"  # Required for paths config
         }
         
-        with patch.dict(os.environ, env_vars, clear=False):
-            config = Config.load()
-            database = config.database
-            
-            # Path should match (may have been normalized)
-            assert database.path == db_path or os.path.samefile(database.path, db_path) if os.path.exists(db_path) else database.path == db_path
+        _set_env(monkeypatch, env_vars)
+        config = Config.load()
+        database = config.database
+        
+        # Path should match (may have been normalized)
+        assert database.path == db_path or os.path.samefile(database.path, db_path) if os.path.exists(db_path) else database.path == db_path
     
-    def test_load_logger_config(self):
+    def test_load_logger_config(self, monkeypatch):
         """Test loading logger configuration."""
-        # Note: Logger config is loaded lazily and may be cached
-        # We need to ensure we're getting a fresh config
         env_vars = {
             "LOGGER_NAME": "test-logger",
             "LOGGER_LEVEL": "DEBUG"
         }
         
-        with patch.dict(os.environ, env_vars, clear=False):
-            # Force reload by clearing singleton
-            Config._instance = None
-            Config._app_config = None
-            config = Config.load()
-            logger = config.logger
-            
-            assert logger.name == "test-logger"
-            assert logger.level == "DEBUG"
+        _set_env(monkeypatch, env_vars)
+        config = Config.load()
+        logger = config.logger
+        
+        assert logger.name == "test-logger"
+        assert logger.level == "DEBUG"
@@ -1,95 +1,77 @@
 """Tests for database connection."""
 import pytest
 import os
+import sqlite3
 import tempfile
-from pathlib import Path
+from contextlib import closing
 from unittest.mock import Mock
 from domain.models.app_config import DatabaseConfig
 from infrastructure.db.connection import DatabaseConnection
+import infrastructure.db.models  # noqa: F401 - registers the tables in Base.metadata
 
 
 class TestDatabaseConnection:
     """Tests for DatabaseConnection."""
     
-    def test_init_creates_engine(self, temp_db_path):
+    @pytest.fixture
+    def conn(self, temp_db_path):
+        """Creates a DatabaseConnection on a temporary database file."""
+        conn = DatabaseConnection(DatabaseConfig(path=temp_db_path), Mock())
+        yield conn
+        conn.engine.dispose()
+    
+    def test_init_creates_engine(self, conn, temp_db_path):
         """Test that __init__ creates SQLAlchemy engine."""
-        db_config = DatabaseConfig(path=temp_db_path)
-        conn = DatabaseConnection(db_config, Mock())
-        
-        assert conn.config == db_config
+        assert conn.config == DatabaseConfig(path=temp_db_path)
         assert conn.engine is not None
         assert conn.SessionLocal is not None
     
-    def test_is_empty_new_database(self, temp_db_path):
+    def test_is_empty_new_database(self, conn):
         """Test is_empty returns True for new database."""
-        db_config = DatabaseConfig(path=temp_db_path)
-        conn = DatabaseConnection(db_config, Mock())
-        
         assert conn.is_empty() is True
     
-    def test_is_empty_existing_database(self, temp_db_path):
+    def test_is_empty_existing_database(self, conn):
         """Test is_empty returns False for existing database with tables."""
-        db_config = DatabaseConfig(path=temp_db_path)
-        conn = DatabaseConnection(db_config, Mock())
-        
         # Create tables
         conn.create_tables()
         
         assert conn.is_empty() is False
     
-    def test_has_all_tables_empty_database(self, temp_db_path):
+    def test_has_all_tables_empty_database(self, conn):
         """Test has_all_tables returns False for empty database."""
-        db_config = DatabaseConfig(path=temp_db_path)
-        conn = DatabaseConnection(db_config, Mock())
-        
         assert conn.has_all_tables() is False
     
-    def test_has_all_tables_with_tables(self, temp_db_path):
+    def test_has_all_tables_with_tables(self, conn):
         """Test has_all_tables returns True when tables exist."""
-        db_config = DatabaseConfig(path=temp_db_path)
-        conn = DatabaseConnection(db_config, Mock())
-        
         # Create tables
         conn.create_tables()
         
         assert conn.has_all_tables() is True
     
-    def test_create_tables(self, temp_db_path):
+    def test_create_tables(self, conn, temp_db_path):
         """Test create_tables creates database tables."""
-        db_config = DatabaseConfig(path=temp_db_path)
-        conn = DatabaseConnection(db_config, Mock())
-        
         conn.create_tables()
         
         # Verify tables were created
         assert conn.has_all_tables() is True
         assert os.path.exists(temp_db_path)
     
-    def test_get_session(self, temp_db_path):
+    def test_get_session(self, conn):
         """Test get_session returns a session."""
-        db_config = DatabaseConfig(path=temp_db_path)
-        conn = DatabaseConnection(db_config, Mock())
-        
         session = conn.get_session()
         
         assert session is not None
         session.close()
     
-    def test_initialize_empty_database(self, temp_db_path):
+    def test_initialize_empty_database(self, conn):
         """Test initialize creates tables for empty database."""
-        db_config = DatabaseConfig(path=temp_db_path)
-        conn = DatabaseConnection(db_config, Mock())
-        
         conn.initialize()
         
         # Verify tables were created
         assert conn.has_all_tables() is True
     
-    def test_initialize_existing_database(self, temp_db_path):
+    def test_initialize_existing_database(self, conn):
         """Test initialize verifies tables for existing database."""
-        db_config = DatabaseConfig(path=temp_db_path)
-        conn = DatabaseConnection(db_config, Mock())
-        
         # Create tables first
         conn.create_tables()
         
@@ -98,46 +80,13 @@ class TestDatabaseConnection:
         
         assert conn.has_all_tables() is True
     
-    def test_initialize_missing_tables_raises_error(self, temp_db_path):
-        """Test initialize raises RuntimeError when tables are missing."""
-        import sqlite3
-        
-        db_config = DatabaseConfig(path=temp_db_path)
-        
-        # Create database file but without tables (just create empty file)
-        Path(temp_db_path).touch()
-        
-        conn = DatabaseConnection(db_config, Mock())
-        
-        # Should raise RuntimeError because database exists but has no tables
-        # Actually, if database is empty (no tables), it will create them
-        # So we need to create a database with some table but not the required ones
-        # For simplicity, we'll test that empty database creates tables
-        # The error case is harder to test without creating a partial schema
-        conn.initialize()
-        
-        # After initialize, tables should exist
-        assert conn.has_all_tables() is True
-    
-    def test_initialize_missing_tables_raises_error(self, temp_db_path):
+    def test_initialize_missing_tables_raises_error(self, conn, temp_db_path):
         """Test initialize raises RuntimeError when required tables are missing."""
-        import sqlite3
-        from infrastructure.db.models import TranscodingModel
+        # Create a database that has a table, but not the required ones
+        with closing(sqlite3.connect(temp_db_path)) as sqlite_conn:
+            sqlite_conn.execute("CREATE TABLE dummy (id INTEGER)")
+            sqlite_conn.commit()
         
-        db_config = DatabaseConfig(path=temp_db_path)
-        conn = DatabaseConnection(db_config, Mock())
-        
-        # Create database with a different table (not the required one)
-        # This simulates a database that exists but doesn't have the right schema
-        # Actually, if database is empty, it will create tables
-        # To test the error case, we'd need to create a database with wrong schema
-        # For now, we test the normal flow
-        
-        # Create empty database file
-        Path(temp_db_path).touch()
-        
-        # Initialize should create tables (empty database)
-        conn.initialize()
-        
-        assert conn.has_all_tables() is True
+        with pytest.raises(RuntimeError, match="missing required tables"):
+            conn.initialize()
 
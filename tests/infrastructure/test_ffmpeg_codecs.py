@@ -1,13 +1,44 @@
 """Tests for FFmpeg codecs utilities."""
+import subprocess
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 from infrastructure.transcoder.ffmpeg_codecs import (
     get_available_hw_codecs,
     get_available_hwaccels,
-    has_codec
+    has_codec,
+    parse_hw_encoder_list,
+    parse_hwaccel_list
 )
 
 
+HW_CODECS_STDOUT = """
+ V..... h264_qsv           Intel QSV H.264 encoder
+ V..... h264_vaapi         H.264 VAAPI encoder
+ V..... hevc_qsv           Intel QSV HEVC encoder
+ V..... libx264            H.264 encoder
+"""
+
+HWACCELS_STDOUT = """
+Hardware acceleration methods:
+qsv
+vaapi
+v4l2m2m
+"""
+
+
+@pytest.fixture
+def mock_ffmpeg():
+    """Patches ffmpeg discovery and execution; returns a setter for the mocked run result."""
+    with patch('infrastructure.transcoder.ffmpeg_codecs.shutil.which', return_value="/usr/bin/ffmpeg"), \
+            patch('infrastructure.transcoder.ffmpeg_codecs.subprocess.run') as mock_subprocess:
+        def set_result(stdout, returncode=0):
+            mock_subprocess.return_value = SimpleNamespace(returncode=returncode, stdout=stdout)
+            return mock_subprocess
+        yield set_result
+
+
 class TestGetAvailableHwCodecs:
     """Tests for get_available_hw_codecs function."""
     
@@ -20,52 +51,19 @@ class TestGetAvailableHwCodecs:
         
         assert codecs == []
     
-    @patch('infrastructure.transcoder.ffmpeg_codecs.subprocess.run')
-    @patch('infrastructure.transcoder.ffmpeg_codecs.shutil.which')
-    def test_returns_hardware_codecs(self, mock_which, mock_subprocess):
-        """Test returns list of hardware codecs."""
-        mock_which.return_value = "/usr/bin/ffmpeg"
-        
-        # Mock FFmpeg output with hardware codecs
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = """
- V..... h264_qsv           Intel QSV H.264 encoder
- V..... h264_vaapi         H.264 VAAPI encoder
- V..... hevc_qsv           Intel QSV HEVC encoder
- V..... libx264            H.264 encoder
-        """
-        mock_subprocess.return_value = mock_result
-        
-        codecs = get_available_hw_codecs()
-        
-        assert "h264_qsv" in codecs
-        assert "h264_vaapi" in codecs
-        assert "hevc_qsv" in codecs
-        assert "libx264" not in codecs  # Software codec, not hardware
+    @pytest.mark.parametrize("returncode,expected", [
+        pytest.param(0, ["h264_qsv", "h264_vaapi", "hevc_qsv"], id="success"),
+        pytest.param(1, [], id="non_zero_returncode"),
+    ])
+    def test_hw_codecs(self, mock_ffmpeg, returncode, expected):
+        """Test get_available_hw_codecs runs ffmpeg and parses its output."""
+        mock_ffmpeg(HW_CODECS_STDOUT, returncode)
+        
+        assert get_available_hw_codecs() == expected
     
-    @patch('infrastructure.transcoder.ffmpeg_codecs.subprocess.run')
-    @patch('infrastructure.transcoder.ffmpeg_codecs.shutil.which')
-    def test_handles_subprocess_error(self, mock_which, mock_subprocess):
+    def test_handles_subprocess_error(self, mock_ffmpeg):
         """Test handles subprocess errors gracefully."""
-        import subprocess
-        
-        mock_which.return_value = "/usr/bin/ffmpeg"
-        mock_subprocess.side_effect = subprocess.TimeoutExpired("ffmpeg", 5)
-        
-        codecs = get_available_hw_codecs()
-        
-        assert codecs == []
-    
-    @patch('infrastructure.transcoder.ffmpeg_codecs.subprocess.run')
-    @patch('infrastructure.transcoder.ffmpeg_codecs.shutil.which')
-    def test_handles_non_zero_returncode(self, mock_which, mock_subprocess):
-        """Test handles non-zero return code."""
-        mock_which.return_value = "/usr/bin/ffmpeg"
-        
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_subprocess.return_value = mock_result
+        mock_ffmpeg("").side_effect = subprocess.TimeoutExpired("ffmpeg", 5)
         
         codecs = get_available_hw_codecs()
         
@@ -84,46 +82,42 @@ class TestGetAvailableHwaccels:
         
         assert hwaccels == []
     
-    @patch('infrastructure.transcoder.ffmpeg_codecs.subprocess.run')
-    @patch('infrastructure.transcoder.ffmpeg_codecs.shutil.which')
-    def test_returns_hwaccels(self, mock_which, mock_subprocess):
-        """Test returns list of hardware acceleration methods."""
-        mock_which.return_value = "/usr/bin/ffmpeg"
-        
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = """
-Hardware acceleration methods:
-qsv
-vaapi
-v4l2m2m
-        """
-        mock_subprocess.return_value = mock_result
-        
-        hwaccels = get_available_hwaccels()
-        
-        assert "qsv" in hwaccels
-        assert "vaapi" in hwaccels
-        assert "v4l2m2m" in hwaccels
+    @pytest.mark.parametrize("returncode,expected", [
+        pytest.param(0, ["qsv", "vaapi", "v4l2m2m"], id="success"),
+        pytest.param(1, [], id="non_zero_returncode"),
+    ])
+    def test_hwaccels(self, mock_ffmpeg, returncode, expected):
+        """Test get_available_hwaccels runs ffmpeg and parses its output."""
+        mock_ffmpeg(HWACCELS_STDOUT, returncode)
+        
+        assert get_available_hwaccels() == expected
+
+
+class TestParseHwEncoderList:
+    """Tests for parse_hw_encoder_list function."""
     
-    @patch('infrastructure.transcoder.ffmpeg_codecs.subprocess.run')
-    @patch('infrastructure.transcoder.ffmpeg_codecs.shutil.which')
-    def test_filters_header_line(self, mock_which, mock_subprocess):
-        """Test filters out header line."""
-        mock_which.return_value = "/usr/bin/ffmpeg"
-        
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = """
-Hardware acceleration methods:
-qsv
-        """
-        mock_subprocess.return_value = mock_result
-        
-        hwaccels = get_available_hwaccels()
-        
-        assert "Hardware acceleration methods:" not in hwaccels
-        assert "qsv" in hwaccels
+    @pytest.mark.parametrize("stdout,expected", [
+        pytest.param(HW_CODECS_STDOUT, ["h264_qsv", "h264_vaapi", "hevc_qsv"], id="hardware_codecs"),
+        pytest.param(" V..... libx264            H.264 encoder\n", [], id="software_only"),
+        pytest.param(" V..... h264_qsv  a\n V..... h264_qsv  b\n", ["h264_qsv"], id="deduplicated"),
+        pytest.param("", [], id="empty"),
+    ])
+    def test_parse_hw_encoder_list(self, stdout, expected):
+        """Test only hardware encoder names are extracted, in order."""
+        assert parse_hw_encoder_list(stdout) == expected
+
+
+class TestParseHwaccelList:
+    """Tests for parse_hwaccel_list function."""
+    
+    @pytest.mark.parametrize("stdout,expected", [
+        pytest.param(HWACCELS_STDOUT, ["qsv", "vaapi", "v4l2m2m"], id="hwaccels"),
+        pytest.param("Hardware acceleration methods:\nqsv\n", ["qsv"], id="header_filtered"),
+        pytest.param("", [], id="empty"),
+    ])
+    def test_parse_hwaccel_list(self, stdout, expected):
+        """Test header and blank lines are skipped."""
+        assert parse_hwaccel_list(stdout) == expected
 
 
 class TestHasCodec:
@@ -1,26 +1,35 @@
 """Tests for local filesystem."""
 import pytest
+import json
 import os
-import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from infrastructure.filesystem.local_filesystem import LocalFilesystem
+from unittest.mock import patch
+from infrastructure.filesystem.local_filesystem import READ_CHUNK_SIZE, SCAN_CACHE_VERSION, LocalFilesystem
 
 
 class TestLocalFilesystem:
     """Tests for LocalFilesystem."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def filesystem(self):
         """Creates a LocalFilesystem instance."""
         return LocalFilesystem(["mp4", "avi", "mkv"])
     
+    @pytest.fixture
+    def media_dir(self, fs):
+        """Creates an in-memory (pyfakefs) media directory."""
+        fs.create_dir("/media")
+        return "/media"
+    
     def test_init_sets_video_extensions(self, filesystem):
         """Test that __init__ sets video extensions."""
         assert filesystem.video_extensions == ["mp4", "avi", "mkv"]
     
-    def test_find_videos_empty_directory(self, filesystem, temp_dir):
+    def test_find_videos_empty_directory(self, filesystem, media_dir):
         """Test find_videos returns empty list for empty directory."""
-        videos = filesystem.find_videos(temp_dir)
+        videos = filesystem.find_videos(media_dir)
         assert videos == []
     
     def test_find_videos_nonexistent_directory(self, filesystem):
@@ -28,108 +37,137 @@ class TestLocalFilesystem:
         videos = filesystem.find_videos("/nonexistent/path")
         assert videos == []
     
-    def test_find_videos_with_files(self, filesystem, temp_dir):
+    def test_find_videos_with_files(self, filesystem, fs, media_dir):
         """Test find_videos finds video files."""
         # Create test video files
-        video1 = os.path.join(temp_dir, "video1.mp4")
-        video2 = os.path.join(temp_dir, "video2.avi")
-        non_video = os.path.join(temp_dir, "document.txt")
+        video1 = f"{media_dir}/video1.mp4"
+        video2 = f"{media_dir}/video2.avi"
+        non_video = f"{media_dir}/document.txt"
         
-        Path(video1).touch()
-        Path(video2).touch()
-        Path(non_video).touch()
+        for path in (video1, video2, non_video):
+            fs.create_file(path)
         
-        videos = filesystem.find_videos(temp_dir)
+        videos = filesystem.find_videos(media_dir)
         
         assert len(videos) == 2
         assert video1 in videos
         assert video2 in videos
         assert non_video not in videos
     
-    def test_find_videos_filters_eadir(self, filesystem, temp_dir):
+    def test_find_videos_extension_case_insensitive(self, filesystem, fs, media_dir):
+        """Test find_videos matches extensions regardless of case."""
+        video = f"{media_dir}/VIDEO.MP4"
+        fs.create_file(video)
+        
+        assert filesystem.find_videos(media_dir) == [video]
+    
+    def test_find_videos_normalizes_configured_extensions(self, fs, media_dir):
+        """Test configured extensions match with or without leading dot and in any case."""
+        video = f"{media_dir}/video.mp4"
+        fs.create_file(video)
+        
+        assert LocalFilesystem([".MP4"]).find_videos(media_dir) == [video]
+    
+    def test_find_videos_skips_hidden_entries(self, filesystem, fs, media_dir):
+        """Test find_videos ignores hidden files and directories."""
+        fs.create_file(f"{media_dir}/.hidden.mp4")
+        fs.create_file(os.path.join(media_dir, ".cache", "video.mp4"))
+        video = f"{media_dir}/video.mp4"
+        fs.create_file(video)
+        
+        assert filesystem.find_videos(media_dir) == [video]
+    
+    def test_find_videos_filters_eadir(self, filesystem, fs, media_dir):
         """Test find_videos filters out @eaDir directories."""
         # Create video in @eaDir
-        eadir = os.path.join(temp_dir, "@eaDir", "video.mp4")
-        Path(eadir).parent.mkdir(parents=True, exist_ok=True)
-        Path(eadir).touch()
+        eadir = os.path.join(media_dir, "@eaDir", "video.mp4")
+        fs.create_file(eadir)
         
         # Create normal video
-        normal_video = os.path.join(temp_dir, "normal.mp4")
-        Path(normal_video).touch()
+        normal_video = f"{media_dir}/normal.mp4"
+        fs.create_file(normal_video)
         
-        videos = filesystem.find_videos(temp_dir)
+        videos = filesystem.find_videos(media_dir)
         
         assert normal_video in videos
         assert eadir not in videos
     
-    def test_find_videos_filters_recycle(self, filesystem, temp_dir):
+    def test_find_videos_filters_recycle(self, filesystem, fs, media_dir):
         """Test find_videos filters out #recycle directories."""
         # Create video in #recycle
-        recycle = os.path.join(temp_dir, "#recycle", "video.mp4")
-        Path(recycle).parent.mkdir(parents=True, exist_ok=True)
-        Path(recycle).touch()
+        recycle = os.path.join(media_dir, "#recycle", "video.mp4")
+        fs.create_file(recycle)
         
-        videos = filesystem.find_videos(temp_dir)
+        videos = filesystem.find_videos(media_dir)
         
         assert recycle not in videos
     
-    def test_file_exists_true(self, filesystem, temp_dir):
+    def test_file_exists_true(self, filesystem, fs, media_dir):
         """Test file_exists returns True for existing file."""
-        test_file = os.path.join(temp_dir, "test.mp4")
-        Path(test_file).touch()
+        test_file = f"{media_dir}/test.mp4"
+        fs.create_file(test_file)
         
         assert filesystem.file_exists(test_file) is True
     
-    def test_file_exists_false(self, filesystem, temp_dir):
+    def test_file_exists_false(self, filesystem, media_dir):
         """Test file_exists returns False for nonexistent file."""
-        test_file = os.path.join(temp_dir, "nonexistent.mp4")
+        test_file = f"{media_dir}/nonexistent.mp4"
         
         assert filesystem.file_exists(test_file) is False
     
-    def test_find_transcoded_video_not_exists(self, filesystem, temp_dir):
+    def test_find_transcoded_video_not_exists(self, filesystem, fs, media_dir):
         """Test find_transcoded_video returns empty string when @eaDir doesn't exist."""
-        video_path = os.path.join(temp_dir, "video.mp4")
-        Path(video_path).touch()
+        video_path = f"{media_dir}/video.mp4"
+        fs.create_file(video_path)
         
         result = filesystem.find_transcoded_video(video_path)
         
         assert result == ""
     
-    def test_find_transcoded_video_exists(self, filesystem, temp_dir):
+    def test_find_transcoded_video_exists(self, filesystem, fs, media_dir):
         """Test find_transcoded_video finds transcoded video."""
-        video_path = os.path.join(temp_dir, "video.mp4")
-        Path(video_path).touch()
+        video_path = f"{media_dir}/video.mp4"
+        fs.create_file(video_path)
         
         # Create @eaDir structure
-        ea_dir = Path(temp_dir) / '@eaDir' / 'video.mp4'
-        ea_dir.mkdir(parents=True, exist_ok=True)
+        ea_dir = Path(media_dir) / '@eaDir' / 'video.mp4'
         transcoded = ea_dir / "SYNOPHOTO_FILM_H.mp4"
-        transcoded.touch()
+        fs.create_file(transcoded)
         
         result = filesystem.find_transcoded_video(video_path)
         
         assert result == str(transcoded)
     
-    def test_find_transcoded_video_finds_m(self, filesystem, temp_dir):
+    def test_find_transcoded_video_finds_m(self, filesystem, fs, media_dir):
         """Test find_transcoded_video finds SYNOPHOTO_FILM_M."""
-        video_path = os.path.join(temp_dir, "video.mp4")
-        Path(video_path).touch()
+        video_path = f"{media_dir}/video.mp4"
+        fs.create_file(video_path)
         
         # Create @eaDir structure with M file
-        ea_dir = Path(temp_dir) / '@eaDir' / 'video.mp4'
-        ea_dir.mkdir(parents=True, exist_ok=True)
+        ea_dir = Path(media_dir) / '@eaDir' / 'video.mp4'
         transcoded_m = ea_dir / "SYNOPHOTO_FILM_M.mp4"
-        transcoded_m.touch()
+        fs.create_file(transcoded_m)
         
         result = filesystem.find_transcoded_video(video_path)
         
         # Should return M (checked first in the list)
         assert result == str(transcoded_m)
     
-    def test_read_file_existing_file(self, filesystem, temp_dir):
+    def test_find_transcoded_video_prefers_m(self, filesystem, fs, media_dir):
+        """Test find_transcoded_video prefers SYNOPHOTO_FILM_M over SYNOPHOTO_FILM_H."""
+        video_path = f"{media_dir}/video.mp4"
+        fs.create_file(video_path)
+        fs.create_file(f"{media_dir}/@eaDir/video.mp4/SYNOPHOTO_FILM_H.mp4")
+        fs.create_file(f"{media_dir}/@eaDir/video.mp4/SYNOPHOTO_FILM_M.mp4")
+        
+        result = filesystem.find_transcoded_video(video_path)
+        
+        assert result == f"{media_dir}/@eaDir/video.mp4/SYNOPHOTO_FILM_M.mp4"
+    
+    def test_read_file_existing_file(self, filesystem, fs, media_dir):
         """Test read_file returns contents of existing file."""
-        test_file = os.path.join(temp_dir, "test.txt")
-        Path(test_file).write_text("hello world", encoding="utf-8")
+        test_file = f"{media_dir}/test.txt"
+        fs.create_file(test_file, contents="hello world", encoding="utf-8")
 
         result = filesystem.read_file(test_file)
 
@@ -141,42 +179,254 @@ class TestLocalFilesystem:
 
         assert result is None
 
-    def test_read_file_read_error(self, filesystem, temp_dir):
+    def test_read_file_read_error(self, filesystem, media_dir):
         """Test read_file returns None when file cannot be read."""
         # Use a directory path instead of file path to cause an error
-        result = filesystem.read_file(temp_dir)
+        result = filesystem.read_file(media_dir)
 
         assert result is None
 
-    def test_ensure_directory_creates_directory(self, filesystem, temp_dir):
+    def test_read_file_fifo(self, filesystem, tmp_path):
+        """Test read_file returns None for a FIFO instead of blocking on it."""
+        fifo = tmp_path / "SYNOINDEX_MEDIA_INFO"
+        os.mkfifo(fifo)
+
+        assert filesystem.read_file(str(fifo)) is None
+
+    def test_read_file_larger_than_read_chunk(self, filesystem, fs, media_dir):
+        """Test read_file returns the whole file when it spans several reads."""
+        contents = "é" * (READ_CHUNK_SIZE + 1)
+        test_file = f"{media_dir}/large.txt"
+        fs.create_file(test_file, contents=contents, encoding="utf-8")
+
+        assert filesystem.read_file(test_file) == contents
+
+    def test_read_file_invalid_utf8(self, filesystem, fs, media_dir):
+        """Test read_file returns None when the file is not valid UTF-8."""
+        test_file = f"{media_dir}/binary.dat"
+        fs.create_file(test_file, contents=b"\xff\xfe\x00")
+
+        assert filesystem.read_file(test_file) is None
+
+    def test_ensure_directory_creates_directory(self, filesystem, media_dir):
         """Test ensure_directory creates a new directory."""
-        new_dir = os.path.join(temp_dir, "new", "nested", "dir")
+        new_dir = os.path.join(media_dir, "new", "nested", "dir")
 
         filesystem.ensure_directory(new_dir)
 
         assert os.path.isdir(new_dir)
 
-    def test_ensure_directory_existing_directory(self, filesystem, temp_dir):
+    def test_ensure_directory_existing_directory(self, filesystem, media_dir):
         """Test ensure_directory does not fail if directory already exists."""
-        filesystem.ensure_directory(temp_dir)
+        filesystem.ensure_directory(media_dir)
+
+        assert os.path.isdir(media_dir)
+
+    def test_ensure_directory_existing_directory_skips_makedirs(self, filesystem, media_dir):
+        """Test ensure_directory does not call makedirs for an existing directory."""
+        with patch("infrastructure.filesystem.local_filesystem.os.makedirs") as mock_makedirs:
+            filesystem.ensure_directory(media_dir)
 
-        assert os.path.isdir(temp_dir)
+        mock_makedirs.assert_not_called()
 
-    def test_find_videos_recursive(self, filesystem, temp_dir):
+    def test_find_videos_recursive(self, filesystem, fs, media_dir):
         """Test find_videos searches recursively."""
         # Create nested directory structure
-        subdir = os.path.join(temp_dir, "subdir", "nested")
-        os.makedirs(subdir, exist_ok=True)
+        subdir = os.path.join(media_dir, "subdir", "nested")
+        fs.create_dir(subdir)
         
-        video1 = os.path.join(temp_dir, "video1.mp4")
-        video2 = os.path.join(subdir, "video2.avi")
+        video1 = f"{media_dir}/video1.mp4"
+        video2 = f"{subdir}/video2.avi"
         
-        Path(video1).touch()
-        Path(video2).touch()
+        for path in (video1, video2):
+            fs.create_file(path)
         
-        videos = filesystem.find_videos(temp_dir)
+        videos = filesystem.find_videos(media_dir)
         
         assert len(videos) == 2
         assert video1 in videos
         assert video2 in videos
 
+    def test_find_videos_follows_symlinked_directories(self, filesystem, fs, media_dir):
+        """Test find_videos descends into symlinked directories, as glob does."""
+        fs.create_file(f"{media_dir}/real/a/x.mp4")
+        fs.create_symlink(f"{media_dir}/link", f"{media_dir}/real")
+        
+        videos = filesystem.find_videos(media_dir)
+        
+        assert videos == [f"{media_dir}/link/a/x.mp4", f"{media_dir}/real/a/x.mp4"]
+
+    def test_find_videos_symlink_loop(self, filesystem, fs, media_dir):
+        """Test find_videos does not recurse forever into a symlink pointing at an ancestor."""
+        fs.create_file(f"{media_dir}/album/x.mp4")
+        fs.create_symlink(f"{media_dir}/album/loop", media_dir)
+        fs.create_symlink(f"{media_dir}/album/self", f"{media_dir}/album")
+        
+        videos = filesystem.find_videos(media_dir)
+        
+        assert videos == [f"{media_dir}/album/x.mp4"]
+
+    
+    @pytest.mark.parametrize("albums,parallel", [(["album"], False), (["a", "b", "c"], True)])
+    def test_find_videos_parallel_subtrees(self, filesystem, fs, media_dir, albums, parallel):
+        """Test top-level subdirectories are walked in a thread pool only when there are several."""
+        expected = [f"{media_dir}/root.mp4"]
+        fs.create_file(expected[0])
+        for album in albums:
+            for path in (f"{media_dir}/{album}/video.mp4", f"{media_dir}/{album}/nested/video.avi"):
+                fs.create_file(path)
+                expected.append(path)
+        
+        with patch('infrastructure.filesystem.local_filesystem.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            videos = filesystem.find_videos(media_dir)
+        
+        assert videos == sorted(expected)
+        assert mock_executor.called is parallel
+
+
+class TestLocalFilesystemScanCache:
+    """Tests for the mtime-keyed scan cache of LocalFilesystem."""
+    
+    @pytest.fixture
+    def media_dir(self, fs):
+        """Creates an in-memory (pyfakefs) media tree with one video per level."""
+        fs.create_file("/media/video1.mp4")
+        fs.create_file("/media/album/video2.mp4")
+        fs.create_dir("/data")
+        # Directories modified in the last seconds are never cached, so age the tree
+        for path in ("/media", "/media/album"):
+            self._set_dir_mtime(path, time.time_ns() - 3600 * 1_000_000_000)
+        return "/media"
+    
+    @staticmethod
+    def _set_dir_mtime(path, mtime_ns):
+        """Sets a directory mtime."""
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    
+    @classmethod
+    def _touch_dir(cls, path):
+        """Bumps a directory mtime, as adding or removing an entry does."""
+        cls._set_dir_mtime(path, os.stat(path).st_mtime_ns + 1_000_000_000)
+    
+    def test_unchanged_directories_are_not_reread(self, media_dir):
+        """Test a second scan reuses cached listings of directories whose mtime did not change."""
+        filesystem = LocalFilesystem(["mp4"], cache_path="/data/scan_cache.json")
+        first = filesystem.find_videos(media_dir)
+        
+        with patch.object(filesystem, '_scan_directory', wraps=filesystem._scan_directory) as mock_scan:
+            second = filesystem.find_videos(media_dir)
+        
+        assert first == second == ["/media/album/video2.mp4", "/media/video1.mp4"]
+        mock_scan.assert_not_called()
+    
+    def test_changed_directory_is_rescanned(self, fs, media_dir):
+        """Test a directory is re-read when its mtime changes."""
+        filesystem = LocalFilesystem(["mp4"], cache_path="/data/scan_cache.json")
+        filesystem.find_videos(media_dir)
+        
+        fs.create_file("/media/album/video3.mp4")
+        self._touch_dir("/media/album")
+        
+        with patch.object(filesystem, '_scan_directory', wraps=filesystem._scan_directory) as mock_scan:
+            videos = filesystem.find_videos(media_dir)
+        
+        assert "/media/album/video3.mp4" in videos
+        mock_scan.assert_called_once_with("/media/album")
+    
+    def test_recently_modified_directory_is_not_cached(self, fs, media_dir):
+        """Test a file added within the mtime granularity of a scan is found by the next scan."""
+        recent_mtime_ns = time.time_ns()
+        self._set_dir_mtime("/media/album", recent_mtime_ns)
+        filesystem = LocalFilesystem(["mp4"], cache_path="/data/scan_cache.json")
+        filesystem.find_videos(media_dir)
+        
+        # Same mtime tick: the new entry leaves the directory mtime unchanged
+        fs.create_file("/media/album/video3.mp4")
+        self._set_dir_mtime("/media/album", recent_mtime_ns)
+        
+        with patch.object(filesystem, '_scan_directory', wraps=filesystem._scan_directory) as mock_scan:
+            videos = filesystem.find_videos(media_dir)
+        
+        assert videos == ["/media/album/video2.mp4", "/media/album/video3.mp4", "/media/video1.mp4"]
+        mock_scan.assert_called_once_with("/media/album")
+    
+    def test_cache_persists_between_instances(self, media_dir):
+        """Test the cache file written by one instance is used by the next one."""
+        LocalFilesystem(["mp4"], cache_path="/data/scan_cache.json").find_videos(media_dir)
+        
+        filesystem = LocalFilesystem(["mp4"], cache_path="/data/scan_cache.json")
+        with patch.object(filesystem, '_scan_directory', wraps=filesystem._scan_directory) as mock_scan:
+            videos = filesystem.find_videos(media_dir)
+        
+        assert videos == ["/media/album/video2.mp4", "/media/video1.mp4"]
+        mock_scan.assert_not_called()
+    
+    def test_corrupt_cache_file_is_ignored(self, fs, media_dir):
+        """Test an unreadable cache file falls back to a full scan."""
+        fs.create_file("/data/scan_cache.json", contents="not json")
+        filesystem = LocalFilesystem(["mp4"], cache_path="/data/scan_cache.json")
+        
+        assert filesystem.find_videos(media_dir) == ["/media/album/video2.mp4", "/media/video1.mp4"]
+    
+    @pytest.mark.parametrize("entry", [
+        5,
+        None,
+        [],
+        "stale",
+        [0, ["video1.mp4"]],
+        ["0", ["video1.mp4"], ["album"]],
+        [0, "video1.mp4", ["album"]],
+        [0, [1], ["album"]],
+    ])
+    def test_malformed_cache_entries_are_rescanned(self, fs, media_dir, entry):
+        """Test malformed cache entries are treated as cache misses instead of breaking the scan."""
+        mtime_ns = os.stat(media_dir).st_mtime_ns
+        if isinstance(entry, list) and entry and entry[0] == 0:
+            entry = [mtime_ns, *entry[1:]]
+        fs.create_file("/data/scan_cache.json", contents=json.dumps({
+            "version": SCAN_CACHE_VERSION,
+            "directories": {media_dir: entry, "/media/album": entry},
+        }))
+        filesystem = LocalFilesystem(["mp4"], cache_path="/data/scan_cache.json")
+        
+        assert filesystem.find_videos(media_dir) == ["/media/album/video2.mp4", "/media/video1.mp4"]
+
+
+@pytest.fixture(scope="module")
+def sample_tree_videos(sample_tree):
+    """Scans the shared sample tree once for the whole module."""
+    return LocalFilesystem(["mp4", "avi", "mkv"]).find_videos(sample_tree)
+
+
+class TestLocalFilesystemSampleTree:
+    """Read-only checks of LocalFilesystem against the shared on-disk sample tree."""
+    
+    @pytest.fixture(scope="module")
+    def filesystem(self):
+        """Creates a LocalFilesystem instance."""
+        return LocalFilesystem(["mp4", "avi", "mkv"])
+    
+    @pytest.mark.parametrize("relative_path,found", [
+        ("video1.mp4", True),
+        ("video2.AVI", True),
+        ("album/nested/video3.mkv", True),
+        ("document.txt", False),
+        (".hidden.mp4", False),
+        ("album/nested/@eaDir/video3.mkv/SYNOPHOTO_FILM_M.mp4", False),
+        ("@eaDir/video1.mp4/SYNOPHOTO_FILM_H.mp4", False),
+        ("#recycle/old.mp4", False),
+    ])
+    def test_find_videos(self, sample_tree_videos, sample_tree, relative_path, found):
+        """Test which files of the sample tree are reported as videos."""
+        assert (os.path.join(sample_tree, relative_path) in sample_tree_videos) is found
+    
+    @pytest.mark.parametrize("relative_path,transcoded", [
+        ("video1.mp4", "@eaDir/video1.mp4/SYNOPHOTO_FILM_H.mp4"),
+        ("album/nested/video3.mkv", "album/nested/@eaDir/video3.mkv/SYNOPHOTO_FILM_M.mp4"),
+        ("video2.AVI", None),
+    ])
+    def test_find_transcoded_video(self, filesystem, sample_tree, relative_path, transcoded):
+        """Test transcoded video lookup on the sample tree."""
+        expected = os.path.join(sample_tree, transcoded) if transcoded else ""
+        
+        assert filesystem.find_transcoded_video(os.path.join(sample_tree, relative_path)) == expected
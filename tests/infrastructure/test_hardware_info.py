@@ -3,13 +3,33 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 from domain.models.hardware import CPUInfo, CPUVendor, HardwareVideoAcceleration
-from infrastructure.hardware.local_hardware_info import LocalHardwareInfo
+from infrastructure.hardware.local_hardware_info import (
+    LocalHardwareInfo,
+    clear_hardware_cache,
+    has_hw_acceleration_device,
+    _fast_cpu_probe,
+    _get_cpu_vendor
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_hardware_cache():
+    """Clears the process-wide detection cache so each test sees its own mocks."""
+    clear_hardware_cache()
+    yield
+    clear_hardware_cache()
 
 
 class TestLocalHardwareInfo:
     """Tests for LocalHardwareInfo."""
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @pytest.fixture(autouse=True)
+    def no_proc_cpuinfo(self):
+        """Disables the /proc/cpuinfo fast path so detection goes through the mocked py-cpuinfo."""
+        with patch('infrastructure.hardware.local_hardware_info._fast_cpu_probe', return_value=None):
+            yield
+    
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_init_no_side_effects(self, mock_path_class, mock_cpuinfo):
         """Test that __init__ does not trigger detection (lazy initialization)."""
@@ -21,8 +41,14 @@ class TestLocalHardwareInfo:
 
         # cpuinfo should not be called during construction
         mock_cpuinfo.assert_not_called()
+    
+    def test_cpuinfo_not_imported_at_module_level(self):
+        """Test py-cpuinfo is only imported when detection needs it."""
+        import infrastructure.hardware.local_hardware_info as local_hardware_info
+        
+        assert not hasattr(local_hardware_info, "cpuinfo")
 
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_lazy_detection_on_property_access(self, mock_path_class, mock_cpuinfo):
         """Test that hardware is detected lazily on property access."""
@@ -45,7 +71,7 @@ class TestLocalHardwareInfo:
         assert hw_info._cpu_info is not None
         assert hw_info._video_acceleration is not None
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_cpu_property_caches(self, mock_path_class, mock_cpuinfo):
         """Test that cpu property caches the result."""
@@ -64,7 +90,7 @@ class TestLocalHardwareInfo:
         assert cpu1 is cpu2
         # Note: cpuinfo.get_cpu_info is called during __init__, so call_count >= 1
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_video_acceleration_property_caches(self, mock_path_class, mock_cpuinfo):
         """Test that video_acceleration property caches the result."""
@@ -82,7 +108,7 @@ class TestLocalHardwareInfo:
         
         assert accel1 is accel2
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_detect_video_acceleration_intel_with_qsv(self, mock_path_class, mock_cpuinfo):
         """Test video acceleration detection for Intel with QSV."""
@@ -99,7 +125,7 @@ class TestLocalHardwareInfo:
         # Should detect QSV for Intel
         assert accel == HardwareVideoAcceleration.QSV
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_detect_video_acceleration_amd_with_vaapi(self, mock_path_class, mock_cpuinfo):
         """Test video acceleration detection for AMD with VAAPI."""
@@ -116,7 +142,7 @@ class TestLocalHardwareInfo:
         # Should detect VAAPI for AMD
         assert accel == HardwareVideoAcceleration.VAAPI
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_detect_video_acceleration_arm_with_v4l2m2m(self, mock_path_class, mock_cpuinfo):
         """Test video acceleration detection for ARM with V4L2M2M."""
@@ -133,7 +159,7 @@ class TestLocalHardwareInfo:
         # Should detect V4L2M2M for ARM
         assert accel == HardwareVideoAcceleration.V4L2M2M
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_detect_video_acceleration_no_hardware(self, mock_path_class, mock_cpuinfo):
         """Test video acceleration detection when no hardware available."""
@@ -150,7 +176,7 @@ class TestLocalHardwareInfo:
         # Should return None when vendor is unknown
         assert accel is None
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_get_cpu_info_exception_handling(self, mock_path_class, mock_cpuinfo):
         """Test _get_cpu_info handles exceptions gracefully."""
@@ -166,7 +192,7 @@ class TestLocalHardwareInfo:
         assert cpu is not None
         assert cpu.vendor.value == "unknown"  # Default vendor
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_get_cpu_cores_various_formats(self, mock_path_class, mock_cpuinfo):
         """Test _get_cpu_cores handles various CPU info formats."""
@@ -186,7 +212,7 @@ class TestLocalHardwareInfo:
         
         assert cpu.cores == 8
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_get_cpu_cores_fallback(self, mock_path_class, mock_cpuinfo):
         """Test _get_cpu_cores falls back to 1 on error."""
@@ -206,7 +232,7 @@ class TestLocalHardwareInfo:
         # Should default to 1 core
         assert cpu.cores == 1
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_get_cpu_cores_with_cpu_count_key(self, mock_path_class, mock_cpuinfo):
         """Test _get_cpu_cores uses 'cpu_count' key."""
@@ -225,7 +251,7 @@ class TestLocalHardwareInfo:
         
         assert cpu.cores == 8
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_get_cpu_cores_with_cores_key(self, mock_path_class, mock_cpuinfo):
         """Test _get_cpu_cores uses 'cores' key."""
@@ -244,7 +270,7 @@ class TestLocalHardwareInfo:
         
         assert cpu.cores == 4
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_get_cpu_cores_non_integer(self, mock_path_class, mock_cpuinfo):
         """Test _get_cpu_cores handles non-integer values."""
@@ -264,7 +290,7 @@ class TestLocalHardwareInfo:
         # Should default to 1
         assert cpu.cores == 1
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_detect_video_acceleration_no_dri_device(self, mock_path_class, mock_cpuinfo):
         """Test _detect_video_acceleration returns None when DRI device missing."""
@@ -286,7 +312,7 @@ class TestLocalHardwareInfo:
         # Should return None when DRI device is missing for Intel/AMD
         assert acceleration is None
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_get_cpu_vendor_detection(self, mock_path_class, mock_cpuinfo):
         """Test _get_cpu_vendor detects different vendors correctly."""
@@ -306,7 +332,7 @@ class TestLocalHardwareInfo:
         
         assert cpu.vendor == CPUVendor.INTEL
     
-    @patch('infrastructure.hardware.local_hardware_info.cpuinfo.get_cpu_info')
+    @patch('cpuinfo.get_cpu_info')
     @patch('infrastructure.hardware.local_hardware_info.Path')
     def test_get_cpu_vendor_amd_detection(self, mock_path_class, mock_cpuinfo):
         """Test _get_cpu_vendor detects AMD."""
@@ -324,4 +350,98 @@ class TestLocalHardwareInfo:
         cpu = hw_info.cpu
         
         assert cpu.vendor == CPUVendor.AMD
+    
+    @patch('cpuinfo.get_cpu_info')
+    @patch('infrastructure.hardware.local_hardware_info.Path')
+    def test_detection_shared_across_instances(self, mock_path_class, mock_cpuinfo):
+        """Test that hardware is detected once per process, not once per instance."""
+        mock_cpuinfo.return_value = {'vendor_id_raw': 'GenuineIntel', 'brand_raw': 'Intel', 'arch': 'x86_64'}
+        mock_path_class.return_value.exists.return_value = True
+        
+        first = LocalHardwareInfo()
+        second = LocalHardwareInfo()
+        
+        assert first.cpu is second.cpu
+        assert first.video_acceleration == second.video_acceleration
+        mock_cpuinfo.assert_called_once()
+        mock_path_class.return_value.exists.assert_called_once()
+
+
+class TestGetCpuVendor:
+    """Tests for _get_cpu_vendor."""
+    
+    @pytest.mark.parametrize("arch,vendor_id,name,expected", [
+        # Exact vendor ids
+        ("x86_64", "genuineintel", "", CPUVendor.INTEL),
+        ("x86_64", "authenticamd", "", CPUVendor.AMD),
+        ("aarch64", "arm", "", CPUVendor.ARM),
+        # Fallback on vendor id substrings, name and architecture
+        ("x86_64", "intel corporation", "", CPUVendor.INTEL),
+        ("x86_64", "", "intel(r) celeron(r) j4125", CPUVendor.INTEL),
+        ("x86_64", "", "amd ryzen embedded v1500b", CPUVendor.AMD),
+        ("aarch64", "", "cortex-a55", CPUVendor.ARM),
+        ("unknown", "unknown", "unknown", CPUVendor.UNKNOWN),
+    ])
+    def test_get_cpu_vendor(self, arch, vendor_id, name, expected):
+        """Test vendor detection from exact ids and from name/arch fallbacks."""
+        assert _get_cpu_vendor(arch=arch, vendor_id=vendor_id, name=name) == expected
+
+
+class TestFastCpuProbe:
+    """Tests for the /proc/cpuinfo fast path."""
+    
+    @patch('infrastructure.hardware.local_hardware_info.os.cpu_count', return_value=4)
+    @patch('infrastructure.hardware.local_hardware_info.platform.machine', return_value='x86_64')
+    def test_reads_first_processor_block(self, mock_machine, mock_cpu_count, tmp_path):
+        """Test vendor and model are read from the first processor block."""
+        cpuinfo_file = tmp_path / "cpuinfo"
+        cpuinfo_file.write_text(
+            "processor\t: 0\nvendor_id\t: GenuineIntel\nmodel name\t: Intel(R) Celeron(R) J4125\n\n"
+            "processor\t: 1\nvendor_id\t: Other\nmodel name\t: Other\n"
+        )
+        
+        raw = _fast_cpu_probe(str(cpuinfo_file))
+        
+        assert raw == {
+            'vendor_id_raw': 'GenuineIntel',
+            'brand_raw': 'Intel(R) Celeron(R) J4125',
+            'arch': 'x86_64',
+            'count': 4,
+        }
+    
+    def test_returns_none_without_model_name(self, tmp_path):
+        """Test None is returned (py-cpuinfo fallback) when model name is missing."""
+        cpuinfo_file = tmp_path / "cpuinfo"
+        cpuinfo_file.write_text("processor\t: 0\nBogoMIPS\t: 48.00\nCPU implementer\t: 0x41\n")
+        
+        assert _fast_cpu_probe(str(cpuinfo_file)) is None
+    
+    def test_returns_none_when_file_missing(self, tmp_path):
+        """Test None is returned when /proc/cpuinfo is unavailable."""
+        assert _fast_cpu_probe(str(tmp_path / "missing")) is None
+    
+    @patch('cpuinfo.get_cpu_info')
+    @patch('infrastructure.hardware.local_hardware_info._fast_cpu_probe')
+    def test_fast_path_skips_py_cpuinfo(self, mock_probe, mock_cpuinfo):
+        """Test py-cpuinfo is not called when the fast path succeeds."""
+        mock_probe.return_value = {'vendor_id_raw': 'AuthenticAMD', 'brand_raw': 'AMD Ryzen', 'arch': 'x86_64', 'count': 8}
+        
+        cpu = LocalHardwareInfo().cpu
+        
+        assert cpu.vendor == CPUVendor.AMD
+        assert cpu.cores == 8
+        mock_cpuinfo.assert_not_called()
 
+
+class TestHasHwAccelerationDevice:
+    """Tests for has_hw_acceleration_device."""
+    
+    @pytest.mark.parametrize("exists", [True, False])
+    @patch('infrastructure.hardware.local_hardware_info.Path')
+    def test_checks_device_once(self, mock_path_class, exists):
+        """Test the DRI device is stat'ed once and the result reused."""
+        mock_path_class.return_value.exists.return_value = exists
+        
+        assert has_hw_acceleration_device() is exists
+        assert has_hw_acceleration_device() is exists
+        mock_path_class.return_value.exists.assert_called_once()
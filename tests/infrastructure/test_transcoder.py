@@ -79,33 +79,10 @@ class TestFFmpegTranscoder:
         assert transcoder.video_encoder is not None
         assert transcoder.audio_encoder is not None
     
-    @patch('infrastructure.transcoder.ffmpeg_transcoder.shutil.which')
     @patch('infrastructure.transcoder.ffmpeg_transcoder.subprocess.run')
-    def test_transcode_success(self, mock_subprocess, mock_which, transcoder):
-        """Test successful transcoding."""
-        mock_which.return_value = "/usr/bin/ffmpeg"
-        mock_subprocess.return_value = Mock(returncode=0)
-        
-        result = transcoder.transcode()
-        
-        assert result is True
-        mock_subprocess.assert_called_once()
-    
-    @patch('infrastructure.transcoder.ffmpeg_transcoder.shutil.which')
-    def test_transcode_ffmpeg_not_found(self, mock_which, transcoder):
-        """Test transcoding when ffmpeg is not found."""
-        mock_which.return_value = None
-        
-        result = transcoder.transcode()
-        
-        assert result is False
-    
-    @patch('infrastructure.transcoder.ffmpeg_transcoder.shutil.which')
-    @patch('infrastructure.transcoder.ffmpeg_transcoder.subprocess.run')
-    def test_transcode_failure(self, mock_subprocess, mock_which, transcoder):
+    def test_transcode_failure(self, mock_subprocess, transcoder):
         """Test transcoding failure."""
         import subprocess
-        mock_which.return_value = "/usr/bin/ffmpeg"
         mock_subprocess.side_effect = subprocess.CalledProcessError(
             returncode=1,
             cmd=["ffmpeg"],
@@ -122,6 +99,16 @@ class TestFFmpegTranscoder:
         
         assert transcoder.transcoding.transcoded_video.path in cmd
     
+    def test_build_ffmpeg_command_uses_ffmpeg_path(self, sample_transcoding, mock_hardware_info, mock_logger):
+        """Test that build_ffmpeg_command uses the resolved ffmpeg path as executable."""
+        transcoder = FFmpegTranscoder(
+            sample_transcoding, mock_hardware_info, mock_logger, ffmpeg_path="/usr/lib/jellyfin-ffmpeg/ffmpeg"
+        )
+
+        cmd = transcoder._build_ffmpeg_command()
+
+        assert cmd[0] == "/usr/lib/jellyfin-ffmpeg/ffmpeg"
+    
     def test_build_ffmpeg_command_includes_input(self, transcoder):
         """Test that build_ffmpeg_command includes input file."""
         cmd = transcoder._build_ffmpeg_command()
@@ -171,8 +158,88 @@ class TestFFmpegTranscoder:
         transcoder = FFmpegTranscoder(sample_transcoding, mock_hw, Mock())
         cmd = transcoder._build_v4l2m2m_command()
         
-        assert "-pix_fmt" in cmd
-        assert "nv12" in cmd
+        # Pixel format conversion happens in the filter graph, not as an output option
+        assert "-pix_fmt" not in cmd
+        assert cmd[cmd.index("-vf") + 1] == "scale=w=-2:h=720,format=nv12"
+    
+    @pytest.mark.parametrize("input_codec,expected_decoder", [
+        ("h264", "h264_v4l2m2m"),
+        ("hevc", "hevc_v4l2m2m"),
+        ("HEVC", "hevc_v4l2m2m"),
+        ("vp9", None),
+        # Unrecognised or missing codecs are normalized to h264 but must not get its decoder
+        ("mjpeg", None),
+        ("prores", None),
+        ("", None),
+    ])
+    def test_build_v4l2m2m_command_decoder(self, sample_transcoding, input_codec, expected_decoder):
+        """Test V4L2M2M input decoder is selected from the original video codec."""
+        original_video = sample_transcoding.original_video.model_copy(
+            update={"video_track": VideoTrack(width=1920, height=1080, codec_name=input_codec, framerate=30)}
+        )
+        transcoding = sample_transcoding.model_copy(update={"original_video": original_video})
+
+        mock_hw = Mock()
+        mock_hw.video_acceleration = HardwareVideoAcceleration.V4L2M2M
+
+        transcoder = FFmpegTranscoder(transcoding, mock_hw, Mock())
+        cmd = transcoder._build_v4l2m2m_command()
+        input_index = cmd.index("-i")
+
+        if expected_decoder:
+            assert cmd[:input_index] == ["-c:v", expected_decoder]
+        else:
+            assert input_index == 0
+        # Encoder is always set after the input
+        assert cmd[cmd.index("-c:v", input_index) + 1] == transcoder.video_encoder
+    
+    @pytest.mark.parametrize("acceleration", [
+        HardwareVideoAcceleration.QSV,
+        HardwareVideoAcceleration.VAAPI,
+        None,
+    ])
+    @pytest.mark.parametrize("fragmented_mp4,expected_movflags", [
+        (False, "+faststart"),
+        (True, "+frag_keyframe+empty_moov+default_base_moof"),
+    ])
+    def test_build_command_movflags(self, sample_transcoding, acceleration, fragmented_mp4, expected_movflags):
+        """Test movflags follow the fragmented_mp4 configuration."""
+        sample_transcoding.configuration.fragmented_mp4 = fragmented_mp4
+
+        mock_hw = Mock()
+        mock_hw.video_acceleration = acceleration
+
+        transcoder = FFmpegTranscoder(sample_transcoding, mock_hw, Mock())
+        cmd = transcoder._build_ffmpeg_command()
+
+        assert cmd[cmd.index("-movflags") + 1] == expected_movflags
+    
+    @pytest.mark.parametrize("acceleration", [
+        HardwareVideoAcceleration.QSV,
+        HardwareVideoAcceleration.VAAPI,
+        HardwareVideoAcceleration.V4L2M2M,
+    ])
+    def test_build_hw_command_fps_mode(self, sample_transcoding, acceleration):
+        """Test hardware commands use -fps_mode instead of the deprecated -vsync."""
+        mock_hw = Mock()
+        mock_hw.video_acceleration = acceleration
+
+        transcoder = FFmpegTranscoder(sample_transcoding, mock_hw, Mock())
+        cmd = transcoder._build_ffmpeg_command()
+
+        assert "-vsync" not in cmd
+        assert cmd[cmd.index("-fps_mode") + 1] == "cfr"
+    
+    def test_build_qsv_command_no_output_sar(self, sample_transcoding):
+        """Test QSV command relies on the setsar filter instead of -sar."""
+        mock_hw = Mock()
+        mock_hw.video_acceleration = HardwareVideoAcceleration.QSV
+
+        transcoder = FFmpegTranscoder(sample_transcoding, mock_hw, Mock())
+        cmd = transcoder._build_qsv_command()
+
+        assert "-sar" not in cmd
+        assert "setsar=1" in cmd[cmd.index("-vf") + 1]
     
     def test_build_software_command(self, sample_transcoding):
         """Test building software command."""
@@ -256,6 +323,28 @@ class TestFFmpegTranscoder:
         if sample_transcoding.configuration.video_profile:
             assert "-profile:v" in cmd
     
+    @pytest.mark.parametrize("acceleration", [HardwareVideoAcceleration.QSV, HardwareVideoAcceleration.VAAPI])
+    def test_build_hw_command_no_threads(self, sample_transcoding, acceleration):
+        """Test that hardware encoders are not limited with -threads."""
+        mock_hw = Mock()
+        mock_hw.video_acceleration = acceleration
+
+        transcoder = FFmpegTranscoder(sample_transcoding, mock_hw, Mock())
+        cmd = transcoder._build_ffmpeg_command()
+
+        assert "-threads" not in cmd
+
+    def test_build_software_command_threads(self, sample_transcoding):
+        """Test that software command uses auto encoder threads and bounded filter threads."""
+        mock_hw = Mock()
+        mock_hw.video_acceleration = None
+
+        transcoder = FFmpegTranscoder(sample_transcoding, mock_hw, Mock())
+        cmd = transcoder._build_software_command()
+
+        assert cmd[cmd.index("-threads") + 1] == "0"
+        assert cmd[cmd.index("-filter_threads") + 1] == str(sample_transcoding.configuration.execution_threads)
+
     def test_build_software_command_includes_profile(self, sample_transcoding):
         """Test that software command includes profile when specified."""
         from domain.models.hardware import HardwareVideoAcceleration
@@ -297,6 +386,21 @@ class TestFFmpegTranscoder:
         assert result is True
         mock_subprocess.assert_called_once()
     
+    @patch('infrastructure.transcoder.ffmpeg_transcoder.subprocess.run')
+    def test_transcode_only_captures_stderr(self, mock_subprocess, transcoder):
+        """Test that ffmpeg runs with stdin/stdout discarded and stderr captured."""
+        import subprocess
+
+        mock_subprocess.return_value = Mock(returncode=0)
+
+        transcoder.transcode()
+
+        kwargs = mock_subprocess.call_args.kwargs
+        assert kwargs["stdin"] == subprocess.DEVNULL
+        assert kwargs["stdout"] == subprocess.DEVNULL
+        assert kwargs["stderr"] == subprocess.PIPE
+        assert "preexec_fn" not in kwargs
+    
     @patch('infrastructure.transcoder.ffmpeg_transcoder.subprocess.run')
     def test_transcode_failure_logs_error(self, mock_subprocess, transcoder):
         """Test that transcoding failure logs error output."""
@@ -317,14 +421,24 @@ class TestFFmpegTranscoder:
         # Should log the error message
         assert any("FFmpeg transcoding failed" in str(call) for call in transcoder.logger.warning.call_args_list)
     
-    @patch('infrastructure.transcoder.ffmpeg_transcoder.shutil.which')
-    def test_transcode_ffmpeg_not_found(self, mock_which, transcoder):
-        """Test that transcode returns False when ffmpeg is not found."""
-        mock_which.return_value = None
-        
+    @patch('infrastructure.transcoder.ffmpeg_transcoder.subprocess.run')
+    def test_transcode_failure_logs_only_stderr_tail(self, mock_subprocess, transcoder):
+        """Test that only the last stderr lines are logged on failure."""
+        import subprocess
+        from infrastructure.transcoder.ffmpeg_transcoder import FFMPEG_ERROR_TAIL_LINES
+
+        stderr = b"\n".join(f"line {i}".encode() for i in range(100)) + b"\n"
+        mock_subprocess.side_effect = subprocess.CalledProcessError(
+            returncode=1,
+            cmd=["ffmpeg", "..."],
+            stderr=stderr
+        )
+
         result = transcoder.transcode()
-        
+
         assert result is False
+        logged_output = transcoder.logger.warning.call_args_list[-1].args[0]
+        assert logged_output.splitlines() == [f"line {i}" for i in range(100 - FFMPEG_ERROR_TAIL_LINES, 100)]
     
     @patch('infrastructure.transcoder.ffmpeg_transcoder.subprocess.run')
     def test_transcode_failure_no_stderr(self, mock_subprocess, transcoder):
@@ -1,6 +1,6 @@
 """Tests for FFmpegTranscoderFactory."""
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from infrastructure.transcoder.ffmpeg_transcoder_factory import FFmpegTranscoderFactory
 from infrastructure.transcoder.ffmpeg_transcoder import FFmpegTranscoder
 
@@ -8,6 +8,13 @@ from infrastructure.transcoder.ffmpeg_transcoder import FFmpegTranscoder
 class TestFFmpegTranscoderFactory:
     """Tests for FFmpegTranscoderFactory."""
 
+    @pytest.fixture(autouse=True)
+    def mock_which(self):
+        """Makes ffmpeg resolvable regardless of the test environment."""
+        with patch('infrastructure.transcoder.ffmpeg_transcoder_factory.shutil.which') as mock:
+            mock.return_value = "/usr/bin/ffmpeg"
+            yield mock
+
     def test_create_returns_ffmpeg_transcoder(self, sample_transcoding_configuration, sample_video):
         """Test that create() returns an FFmpegTranscoder instance."""
         from domain.models.transcoding import Transcoding, TranscodingStatus
@@ -27,3 +34,55 @@ class TestFFmpegTranscoderFactory:
         transcoder = factory.create(transcoding)
 
         assert isinstance(transcoder, FFmpegTranscoder)
+
+    def test_create_reuses_resolved_hardware_backend(self, sample_transcoding_configuration, sample_video):
+        """Test that the hardware backend is resolved once and shared by created transcoders."""
+        from domain.models.transcoding import Transcoding, TranscodingStatus
+        from domain.models.hardware import HardwareVideoAcceleration
+        from domain.constants.hardware import HardwareBackend
+
+        mock_hardware_info = Mock()
+        mock_hardware_info.video_acceleration = HardwareVideoAcceleration.QSV
+
+        transcoding = Transcoding(
+            original_video=sample_video,
+            transcoded_video=sample_video,
+            configuration=sample_transcoding_configuration,
+            status=TranscodingStatus.PENDING
+        )
+
+        factory = FFmpegTranscoderFactory(mock_hardware_info, Mock())
+        # Changing the hardware info afterwards must not affect the cached backend
+        mock_hardware_info.video_acceleration = None
+        transcoder = factory.create(transcoding)
+
+        assert factory.hardware_backend == HardwareBackend.QSV
+        assert transcoder.hardware_backend == HardwareBackend.QSV
+
+    def test_init_resolves_ffmpeg_path(self, mock_which, sample_transcoding_configuration, sample_video):
+        """Test that the ffmpeg path is resolved once and passed to created transcoders."""
+        from domain.models.transcoding import Transcoding, TranscodingStatus
+
+        transcoding = Transcoding(
+            original_video=sample_video,
+            transcoded_video=sample_video,
+            configuration=sample_transcoding_configuration,
+            status=TranscodingStatus.PENDING
+        )
+
+        factory = FFmpegTranscoderFactory(Mock(video_acceleration=None), Mock())
+        factory.create(transcoding)
+        factory.create(transcoding)
+
+        mock_which.assert_called_once_with("ffmpeg")
+        assert factory.create(transcoding).ffmpeg_path == "/usr/bin/ffmpeg"
+
+    def test_init_raises_when_ffmpeg_not_found(self, mock_which):
+        """Test that the factory fails fast when ffmpeg is not installed."""
+        mock_which.return_value = None
+        mock_logger = Mock()
+
+        with pytest.raises(RuntimeError, match="FFmpeg executable not found"):
+            FFmpegTranscoderFactory(Mock(video_acceleration=None), mock_logger)
+
+        mock_logger.error.assert_called_once()
@@ -1,6 +1,7 @@
 """Tests for infrastructure utilities."""
 import pytest
-from infrastructure.utils import to_int
+from unittest.mock import patch
+from infrastructure.utils import to_int, to_cpu_list
 
 
 class TestToInt:
@@ -22,3 +23,53 @@ class TestToInt:
         """Test to_int returns 0 when no default provided."""
         assert to_int("invalid") == 0
         assert to_int(None) == 0
+    
+    def test_to_int_int_value(self):
+        """Test to_int returns int values unchanged."""
+        assert to_int(7) == 7
+        assert to_int(-3) == -3
+    
+    def test_to_int_bool_returns_default(self):
+        """Test to_int does not treat booleans as integers."""
+        assert to_int(True, default=5) == 5
+        assert to_int(False, default=5) == 5
+    
+    def test_to_int_string_with_whitespace(self):
+        """Test to_int strips surrounding whitespace from strings."""
+        assert to_int(" 42 ") == 42
+        assert to_int("\t-7\n") == -7
+    
+    def test_to_int_non_ascii_digits_return_default(self):
+        """Test to_int returns default for digit-like strings int() cannot parse."""
+        assert to_int("²", default=3) == 3
+
+
+class TestToCpuList:
+    """Tests for to_cpu_list utility function."""
+    
+    @pytest.mark.parametrize("value,expected", [
+        ("1", [1]),
+        ("1-3", [1, 2, 3]),
+        ("0,2,4-5", [0, 2, 4, 5]),
+        (" 3, 1 ", [1, 3]),
+        ("1-2,2-3", [1, 2, 3]),
+    ])
+    def test_to_cpu_list_valid(self, value, expected):
+        """Test to_cpu_list parses taskset-style CPU lists."""
+        assert to_cpu_list(value, cpu_count=8) == expected
+    
+    @pytest.mark.parametrize("value", [None, "", "  ", "a", "3-1", "-1", "1,,2", 5])
+    def test_to_cpu_list_invalid(self, value):
+        """Test to_cpu_list returns None for empty or invalid input."""
+        assert to_cpu_list(value, cpu_count=8) is None
+    
+    @pytest.mark.parametrize("value", ["8", "0-8", "0,9", "0-99999999"])
+    def test_to_cpu_list_out_of_range(self, value):
+        """Test to_cpu_list rejects CPUs the system does not have (huge ranges are never expanded)."""
+        assert to_cpu_list(value, cpu_count=8) is None
+    
+    @patch("infrastructure.utils.os.cpu_count", return_value=4)
+    def test_to_cpu_list_defaults_to_os_cpu_count(self, mock_cpu_count):
+        """Test the CPU limit defaults to os.cpu_count()."""
+        assert to_cpu_list("0-3") == [0, 1, 2, 3]
+        assert to_cpu_list("0-4") is None
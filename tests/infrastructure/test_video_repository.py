@@ -6,7 +6,7 @@ from unittest.mock import Mock
 from domain.models.transcoding import Transcoding, TranscodingStatus
 from domain.models.video import Video, VideoTrack, AudioTrack, Container
 from domain.models.app_config import DatabaseConfig
-from infrastructure.db.connection import DatabaseConnection
+from infrastructure.db.connection import Base, DatabaseConnection
 from infrastructure.db.video_repository_sql import VideoRepositorySQL
 
 
@@ -14,12 +14,14 @@ class TestVideoRepositorySQL:
     """Tests for VideoRepositorySQL."""
     
     @pytest.fixture
-    def db_connection(self, temp_db_path):
-        """Creates a database connection for testing."""
-        db_config = DatabaseConfig(path=temp_db_path)
-        conn = DatabaseConnection(db_config, Mock())
-        conn.initialize()
-        return conn
+    def db_connection(self, db_engine):
+        """Creates a database connection on the shared in-memory engine (emptied after each test)."""
+        db_config = DatabaseConfig(path=":memory:")
+        conn = DatabaseConnection(db_config, Mock(), engine=db_engine)
+        yield conn
+        with db_engine.begin() as connection:
+            for table in reversed(Base.metadata.sorted_tables):
+                connection.execute(table.delete())
     
     @pytest.fixture
     def repository(self, db_connection):
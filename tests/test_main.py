@@ -8,18 +8,39 @@ import importlib
 class TestSignalHandler:
     """Tests for signal handler."""
     
-    def test_signal_handler_sets_shutdown_flag(self):
-        """Test that signal handler sets _shutdown_requested flag."""
+    def test_signal_handler_sets_shutdown_event(self):
+        """Test that signal handler sets the _shutdown_event."""
         # Import main module
         import main
         
-        # Reset flag using the module's global
-        main._shutdown_requested = False
+        # Reset event using the module's global
+        main._shutdown_event.clear()
         
         # Call signal handler
         main._signal_handler(signum=2, frame=None)
         
-        assert main._shutdown_requested is True
+        assert main._shutdown_event.is_set() is True
+        main._shutdown_event.clear()
+
+
+class TestNextWakeupTimeout:
+    """Tests for _next_wakeup_timeout function."""
+
+    @pytest.mark.parametrize("idle_seconds,expected", [
+        (None, 60),
+        (3600, 60),
+        (30, 30),
+        (0, 1),
+        (-5, 1),
+    ])
+    @patch('main.schedule')
+    def test_next_wakeup_timeout(self, mock_schedule, idle_seconds, expected):
+        """Test that the wait timeout follows the scheduler and stays within bounds."""
+        import main
+
+        mock_schedule.idle_seconds.return_value = idle_seconds
+
+        assert main._next_wakeup_timeout() == expected
 
 
 class TestRunProcessing:
@@ -94,6 +115,49 @@ class TestRunProcessing:
         assert any("Error during video processing" in str(call) for call in mock_logger.error.call_args_list)
 
 
+class TestApplyProcessPriority:
+    """Tests for _apply_process_priority function."""
+    
+    @patch('main.os.sched_setaffinity', create=True)
+    @patch('main.os.nice')
+    def test_apply_process_priority(self, mock_nice, mock_setaffinity):
+        """Test nice level and CPU affinity are applied to the current process."""
+        import main
+        
+        transcoding_config = Mock(nice_level=10, cpu_affinity=[1, 2, 3])
+        main._apply_process_priority(transcoding_config, Mock())
+        
+        mock_nice.assert_called_once_with(10)
+        mock_setaffinity.assert_called_once_with(0, [1, 2, 3])
+    
+    @patch('main.os.sched_setaffinity', create=True)
+    @patch('main.os.nice')
+    def test_apply_process_priority_disabled(self, mock_nice, mock_setaffinity):
+        """Test nothing is changed when nice level is 0 and no affinity is set."""
+        import main
+        
+        transcoding_config = Mock(nice_level=0, cpu_affinity=None)
+        main._apply_process_priority(transcoding_config, Mock())
+        
+        mock_nice.assert_not_called()
+        mock_setaffinity.assert_not_called()
+    
+    @patch('main.os.sched_setaffinity', create=True)
+    @patch('main.os.nice')
+    def test_apply_process_priority_errors_are_warnings(self, mock_nice, mock_setaffinity):
+        """Test OS errors are logged as warnings instead of aborting startup."""
+        import main
+        
+        mock_nice.side_effect = OSError("Operation not permitted")
+        mock_setaffinity.side_effect = OSError("Invalid argument")
+        mock_logger = Mock()
+        transcoding_config = Mock(nice_level=10, cpu_affinity=[64])
+        
+        main._apply_process_priority(transcoding_config, mock_logger)
+        
+        assert mock_logger.warning.call_count == 2
+
+
 class TestMain:
     """Tests for main() function."""
     
@@ -107,8 +171,8 @@ class TestMain:
     @patch('main.MainController')
     @patch('main.signal.signal')
     @patch('main.schedule')
-    @patch('main.time.sleep')
-    def test_main_shutdown_during_startup_delay(self, mock_sleep, mock_schedule, mock_signal,
+    @patch('main._shutdown_event')
+    def test_main_shutdown_during_startup_delay(self, mock_event, mock_schedule, mock_signal,
                                                 mock_main_controller, mock_use_case,
                                                 mock_transcoder_factory,
                                                 mock_hardware_info, mock_filesystem,
@@ -119,9 +183,12 @@ class TestMain:
         # Setup mocks
         mock_config_instance = Mock()
         mock_config_instance.paths.media_path = "/test"
+        mock_config_instance.database.path = "/test/data/transcodings.db"
         mock_config_instance.transcoding.startup_delay = 1
         mock_config_instance.transcoding.execution_interval = 60
         mock_config_instance.transcoding.execution_threads = 2
+        mock_config_instance.transcoding.nice_level = 0
+        mock_config_instance.transcoding.cpu_affinity = None
         mock_config_instance.transcoding.video = Mock()
         mock_config_instance.transcoding.audio = Mock()
         mock_config.load.return_value = mock_config_instance
@@ -135,18 +202,17 @@ class TestMain:
         mock_hw_instance.video_acceleration = None
         mock_hardware_info.return_value = mock_hw_instance
 
-        # Set shutdown flag after first sleep
-        def side_effect_sleep(seconds):
-            main._shutdown_requested = True
-        mock_sleep.side_effect = side_effect_sleep
-
-        # Reset shutdown flag
-        main._shutdown_requested = False
+        # Shutdown is requested while waiting for the startup delay
+        mock_event.is_set.return_value = True
 
         main.main()
 
         # Should have called signal handlers
         assert mock_signal.call_count == 2  # SIGTERM and SIGINT
+        # Startup delay is a single interruptible wait (minutes -> seconds)
+        mock_event.wait.assert_called_once_with(timeout=60)
+        # No processing should be scheduled after shutdown
+        mock_schedule.every.assert_not_called()
 
     @patch('main.Config')
     @patch('main.DatabaseConnection')
@@ -158,8 +224,8 @@ class TestMain:
     @patch('main.MainController')
     @patch('main.signal.signal')
     @patch('main.schedule')
-    @patch('main.time.sleep')
-    def test_main_keyboard_interrupt(self, mock_sleep, mock_schedule, mock_signal,
+    @patch('main._shutdown_event')
+    def test_main_keyboard_interrupt(self, mock_event, mock_schedule, mock_signal,
                                      mock_main_controller, mock_use_case,
                                      mock_transcoder_factory,
                                      mock_hardware_info, mock_filesystem,
@@ -170,9 +236,12 @@ class TestMain:
         # Setup mocks
         mock_config_instance = Mock()
         mock_config_instance.paths.media_path = "/test"
+        mock_config_instance.database.path = "/test/data/transcodings.db"
         mock_config_instance.transcoding.startup_delay = 0
         mock_config_instance.transcoding.execution_interval = 60
         mock_config_instance.transcoding.execution_threads = 2
+        mock_config_instance.transcoding.nice_level = 0
+        mock_config_instance.transcoding.cpu_affinity = None
         mock_config_instance.transcoding.video = Mock()
         mock_config_instance.transcoding.audio = Mock()
         mock_config.load.return_value = mock_config_instance
@@ -189,8 +258,8 @@ class TestMain:
         # Make schedule.run_pending raise KeyboardInterrupt
         mock_schedule.run_pending.side_effect = KeyboardInterrupt()
 
-        # Reset shutdown flag
-        main._shutdown_requested = False
+        # No shutdown requested
+        mock_event.is_set.return_value = False
 
         main.main()
 
@@ -207,9 +276,9 @@ class TestMain:
     @patch('main.MainController')
     @patch('main.signal.signal')
     @patch('main.schedule')
-    @patch('main.time.sleep')
+    @patch('main._shutdown_event')
     @patch('sys.exit')
-    def test_main_exception_handling(self, mock_exit, mock_sleep, mock_schedule, mock_signal,
+    def test_main_exception_handling(self, mock_exit, mock_event, mock_schedule, mock_signal,
                                      mock_main_controller, mock_use_case,
                                      mock_transcoder_factory,
                                      mock_hardware_info, mock_filesystem,
@@ -221,9 +290,6 @@ class TestMain:
         mock_config_instance = Mock()
         mock_config.load.side_effect = Exception("Config error")
 
-        # Reset shutdown flag
-        main._shutdown_requested = False
-
         main.main()
 
         # Should have called sys.exit(1)